@@ -1,10 +1,75 @@
+import asyncio
+import copy
+import functools
 import json
+import logging
+import os
+import re
 import requests
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+import uuid
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import date, datetime
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialise obj to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Whitespace control characters removed from free-text payload fields
+_CONTROL_CHARS = str.maketrans("", "", "\t\n\r\x0b\x0c")
+
+_ISO_DATE_RE = re.compile(r"^([0-9]{4})-([0-9]{2})-([0-9]{2})$")
+
+# Responses larger than this (bytes) are summarized with a streaming parser
+_STREAM_PARSE_THRESHOLD = 64_000
+
+# Bulk check creation retries the same statuses, attempts and backoff as the
+# session's Retry policy; each person's retries share an Idempotency-Key so a
+# retried 5xx can never create a duplicate check
+_BULK_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+_BULK_MAX_RETRIES = 5
+_BULK_BACKOFF_FACTOR = 0.5
+
+_OPTIONAL_CHECK_FIELDS = ("middle_name", "ssn", "email", "phone", "reference_id")
+_ADDRESS_FIELDS = ("street", "city", "state", "zip_code")
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Seconds to wait before retry `attempt` (0-based): Retry-After if given in seconds, else backoff."""
+    if retry_after and retry_after.strip().isdigit():
+        return float(retry_after)
+    return _BULK_BACKOFF_FACTOR * (2 ** attempt)
+
+def _clean(value: Optional[str]) -> Optional[str]:
+    """Strip surrounding whitespace and drop embedded control characters."""
+    return value.strip().translate(_CONTROL_CHARS) if value else value
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a JSON config file; keyed on mtime so edits invalidate the cache."""
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
 @dataclass
 class CheckrConfig:
     """Configuration class for Checkr API credentials and settings."""
@@ -15,24 +80,59 @@ class CheckrConfig:
     token_endpoint: str
     client_id: Optional[str] = None
     client_secret: Optional[str] = None
+    rate_per_sec: float = 10.0
+    burst: int = 20
     token_issued_at: datetime = None
     
     def __post_init__(self):
         if self.token_issued_at is None:
             self.token_issued_at = datetime.now()
+        self.update_expiry_deadline()
+    
+    def update_expiry_deadline(self):
+        """Recompute the monotonic expiry deadline (with 5-minute buffer) from token_issued_at."""
+        elapsed = (datetime.now() - self.token_issued_at).total_seconds()
+        self._expiry_monotonic = time.monotonic() + self.expires_in - 300 - elapsed
     
     def is_token_expired(self) -> bool:
         """Check if the access token has expired (with 5-minute buffer)."""
-        if self.token_issued_at is None:
-            return True
-        
-        expiry_time = self.token_issued_at + timedelta(seconds=self.expires_in - 300)
-        return datetime.now() > expiry_time
+        return time.monotonic() >= self._expiry_monotonic
+    
+    def seconds_until_expiry(self) -> float:
+        """Seconds remaining until the 5-minute-early expiry deadline (never negative)."""
+        return max(0.0, self._expiry_monotonic - time.monotonic())
     
     def get_token_url(self) -> str:
         """Get the complete token endpoint URL."""
         return f"{self.base_url}{self.token_endpoint}"
 
+class TokenBucket:
+    """Thread-safe token bucket that keeps sustained request rate under the API quota."""
+    
+    def __init__(self, rate_per_sec: float, burst: int):
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate_per_sec)
+            self._last_refill = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_sec
+    
+    def acquire(self):
+        """Block until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
 class CheckrAPIClient:
     """
     Checkr Trust API Client for instant criminal background checks.
@@ -42,6 +142,12 @@ class CheckrAPIClient:
     official Checkr Trust API documentation.
     """
     
+    # How each supported HTTP method carries its payload
+    _PAYLOAD_MODES = {"GET": "params", "POST": "body", "PUT": "body", "DELETE": "none"}
+    
+    # Most completed checks kept in the status cache (least recently used go first)
+    STATUS_CACHE_SIZE = 256
+    
     def __init__(self, config_file_path: str = "checkr_config.json"):
         """
         Initialize the Checkr API client.
@@ -51,11 +157,29 @@ class CheckrAPIClient:
         """
         self.config = self._load_configuration(config_file_path)
         self.session = requests.Session()
+        self._bucket = TokenBucket(self.config.rate_per_sec, self.config.burst)
+        self._setup_session()
         self._setup_session_headers()
-        
-        print(f"✓ Checkr API Client initialized successfully")
-        print(f"  Base URL: {self.config.base_url}")
-        print(f"  Token expires in: {self.config.expires_in} seconds")
+        self._checks_url = f"{self.config.base_url}/v1/checks"
+        self._checks_get_prefix = f"{self._checks_url}/"
+        
+        # Completed checks rarely change, so their responses are reused for a
+        # while; pending checks are never cached
+        self.status_cache_ttl = 300.0
+        self._status_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._status_inflight: Dict[str, Future] = {}
+        self._status_lock = threading.Lock()
+        
+        # Refresh the token in the background shortly before it expires;
+        # _refresh_future coalesces concurrent refreshes into one request
+        self._refresh_lock = threading.Lock()
+        self._refresh_future: Optional[Future] = None
+        self._refresh_timer = None
+        if self.config.client_id and self.config.client_secret:
+            self._schedule_refresh()
+        
+        logger.info("Checkr API Client initialized (base URL: %s, token expires in %s seconds)",
+                    self.config.base_url, self.config.expires_in)
     
     def _load_configuration(self, config_path: str) -> CheckrConfig:
         """
@@ -68,8 +192,7 @@ class CheckrAPIClient:
             Validated CheckrConfig object
         """
         try:
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
+            config_data = _load_config_cached(config_path, os.path.getmtime(config_path))
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         except json.JSONDecodeError as e:
@@ -92,32 +215,77 @@ class CheckrAPIClient:
             base_url=base_url,
             token_endpoint=token_endpoint,
             client_id=config_data.get("client_id"),
-            client_secret=config_data.get("client_secret")
+            client_secret=config_data.get("client_secret"),
+            rate_per_sec=config_data.get("rate_per_sec", 10.0),
+            burst=config_data.get("burst", 20)
         )
     
+    def _setup_session(self):
+        """
+        Mount a pooled, retrying HTTP adapter on the session.
+        
+        Keeps TLS connections to the API host alive across calls and lets the
+        transport layer retry 429/5xx responses, honouring Retry-After.
+        
+        Only GETs and the token POST are retried: a retried POST /v1/checks
+        whose first attempt was processed would create a duplicate check.
+        """
+        def adapter(methods):
+            retry = Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(methods),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+            return HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=64,
+                pool_block=False,
+                max_retries=retry
+            )
+        
+        default_adapter = adapter(["GET"])
+        self.session.mount("https://", default_adapter)
+        self.session.mount("http://", default_adapter)
+        # Longest matching prefix wins, so only the token endpoint retries POST
+        self.session.mount(self.config.get_token_url(), adapter(["GET", "POST"]))
+    
     def _setup_session_headers(self):
         """Configure session headers for API authentication."""
+        self._auth_header = f"{self.config.token_type} {self.config.access_token}"
         self.session.headers.update({
-            "Authorization": f"{self.config.token_type} {self.config.access_token}",
+            "Authorization": self._auth_header,
             "Content-Type": "application/json",
             "Accept": "application/json",
-            "User-Agent": "CheckrTrustAPIClient/1.0"
+            "User-Agent": "CheckrTrustAPIClient/1.0",
+            # Ask proxies to keep the pooled connection open between calls
+            "Connection": "keep-alive"
         })
     
     def _validate_token(self):
         """
         Validate that the access token is still valid.
         
+        Expired tokens are refreshed automatically when client credentials
+        are configured.
+        
         Raises:
-            Exception: If token has expired
+            Exception: If token has expired and cannot be refreshed
         """
         if self.config.is_token_expired():
+            if self.config.client_id and self.config.client_secret:
+                self.refresh_token()
+                return
             raise Exception(
                 f"Access token expired. Token was issued at {self.config.token_issued_at}, "
                 f"expires after {self.config.expires_in} seconds. Please refresh the token."
             )
     
-    def _format_date(self, date_str: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_date(date_str: str) -> str:
         """
         Convert date from YYYY-MM-DD format to YYYYMMDD format required by API.
         
@@ -134,14 +302,62 @@ class CheckrAPIClient:
         if len(date_str) == 8 and date_str.isdigit():
             return date_str
         
-        # Convert from YYYY-MM-DD to YYYYMMDD
+        # Fast path for YYYY-MM-DD: validate the components, then join them
+        match = _ISO_DATE_RE.match(date_str)
+        if match:
+            year, month, day = match.groups()
+            try:
+                date(int(year), int(month), int(day))
+            except ValueError:
+                raise ValueError(f"Invalid date format: {date_str}. Expected YYYY-MM-DD or YYYYMMDD")
+            return year + month + day
+        
+        # Fall back to strptime for looser input and the descriptive error
         try:
             date_obj = datetime.strptime(date_str, "%Y-%m-%d")
             return date_obj.strftime("%Y%m%d")
         except ValueError:
             raise ValueError(f"Invalid date format: {date_str}. Expected YYYY-MM-DD or YYYYMMDD")
     
-    def _make_request(self, method: str, endpoint: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _build_check_payload(self, person: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the /v1/checks request body for a single person.
+        
+        Args:
+            person: Dict with the same keys as create_instant_criminal_check's arguments
+            
+        Returns:
+            Request payload with empty fields dropped and dob in YYYYMMDD format
+        """
+        # Build the request payload according to API documentation
+        check_data = {
+            "first_name": _clean(person["first_name"]),
+            "last_name": _clean(person["last_name"])
+        }
+        
+        # Add optional fields if provided
+        check_data.update({
+            key: _clean(person[key]) for key in _OPTIONAL_CHECK_FIELDS if person.get(key)
+        })
+        
+        dob = person.get("dob")
+        if dob:
+            # Convert date to YYYYMMDD format required by API
+            check_data["dob"] = self._format_date(dob)
+        
+        address = person.get("address")
+        if address:
+            # Format address according to API documentation
+            address_data = {
+                key: _clean(address[key]) for key in _ADDRESS_FIELDS if address.get(key)
+            }
+            if address_data:  # Only add if we have address data
+                check_data["address"] = address_data
+        
+        return check_data
+    
+    def _make_request(self, method: str, endpoint: str, payload: Optional[Dict[str, Any]] = None,
+                      url: Optional[str] = None) -> Dict[str, Any]:
         """
         Make an authenticated HTTP request to the Checkr API.
         
@@ -149,70 +365,121 @@ class CheckrAPIClient:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint path
             payload: Request body data
+            url: Prebuilt absolute URL for `endpoint`, skipping URL construction
             
         Returns:
             JSON response as dictionary
         """
+        mode = self._PAYLOAD_MODES.get(method)
+        if mode is None:
+            method = method.upper()
+            mode = self._PAYLOAD_MODES.get(method)
+            if mode is None:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+        
         self._validate_token()
+        self._bucket.acquire()
         
-        url = f"{self.config.base_url}{endpoint}"
+        if url is None:
+            url = f"{self.config.base_url}{endpoint}"
         
-        print(f"→ {method.upper()} {url}")
-        if payload:
-            print(f"  Payload: {json.dumps(payload, indent=2)}")
+        logger.debug("→ %s %s", method, url)
+        if payload and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Payload: %s", _json_dumps(payload).decode("utf-8"))
         
         try:
-            if method.upper() == "GET":
-                response = self.session.get(url, params=payload)
-            elif method.upper() == "POST":
-                response = self.session.post(url, json=payload)
-            elif method.upper() == "PUT":
-                response = self.session.put(url, json=payload)
-            elif method.upper() == "DELETE":
-                response = self.session.delete(url)
+            # Call Session.request directly rather than the per-verb wrappers
+            if mode == "body":
+                body = _json_dumps(payload) if payload is not None else None
+                response = self.session.request(method, url, data=body)
+            elif mode == "params":
+                response = self.session.request(method, url, params=payload)
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+                response = self.session.request(method, url)
             
-            print(f"  Response: {response.status_code}")
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Request failed: {e}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+        
+        return self._parse_response(response)
+    
+    def _parse_response(self, response: requests.Response) -> Dict[str, Any]:
+        """
+        Raise for HTTP errors and decode the JSON body of an API response.
+        
+        Args:
+            response: Response returned by the session
             
+        Returns:
+            JSON response as dictionary
+        """
+        logger.debug("  Response: %s", response.status_code)
+        
+        try:
             # Check for HTTP errors
             response.raise_for_status()
             
             # Parse and return JSON
-            return response.json()
+            return _json_loads(response.content)
             
         except requests.exceptions.HTTPError as e:
             # Handle HTTP errors with detailed information
             error_details = f"HTTP {response.status_code}: {e}"
             try:
-                api_error = response.json()
+                api_error = _json_loads(response.content)
                 error_details += f"\nAPI Response: {json.dumps(api_error, indent=2)}"
             except:
                 error_details += f"\nResponse Text: {response.text}"
             
-            print(f"❌ {error_details}")
+            logger.error(error_details)
             raise Exception(error_details)
             
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Request failed: {e}"
-            print(f"❌ {error_msg}")
-            raise Exception(error_msg)
-            
         except json.JSONDecodeError as e:
             error_msg = f"Invalid JSON response: {e}\nResponse: {response.text}"
-            print(f"❌ {error_msg}")
+            logger.error(error_msg)
             raise Exception(error_msg)
     
     def refresh_token(self) -> Dict[str, Any]:
         """
         Refresh the access token using client credentials.
         
+        Concurrent callers share a single in-flight token request: the first
+        caller performs the refresh and the rest wait for its result.
+        
         Returns:
             New token information
         """
         if not self.config.client_id or not self.config.client_secret:
             raise ValueError("client_id and client_secret required for token refresh")
         
+        with self._refresh_lock:
+            future = self._refresh_future
+            is_owner = future is None
+            if is_owner:
+                future = self._refresh_future = Future()
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            token_data = self._request_new_token()
+            future.set_result(token_data)
+            return token_data
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._refresh_lock:
+                self._refresh_future = None
+    
+    def _request_new_token(self) -> Dict[str, Any]:
+        """
+        Request a new access token and install it on the client.
+        
+        Returns:
+            New token information
+        """
         token_url = self.config.get_token_url()
         
         credentials = {
@@ -220,16 +487,12 @@ class CheckrAPIClient:
             "client_secret": self.config.client_secret
         }
         
-        # Create temporary session for token request
-        temp_session = requests.Session()
-        temp_session.headers.update({
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        })
-        
         try:
-            print(f"🔄 Refreshing token at {token_url}")
-            response = temp_session.post(token_url, json=credentials)
+            logger.info("Refreshing token at %s", token_url)
+            # Reuse the pooled session; a None value drops the stale
+            # Authorization header for this request only
+            response = self.session.post(token_url, json=credentials,
+                                         headers={"Authorization": None})
             response.raise_for_status()
             
             token_data = response.json()
@@ -239,20 +502,63 @@ class CheckrAPIClient:
             self.config.expires_in = token_data["expires_in"]
             self.config.token_type = token_data["token_type"]
             self.config.token_issued_at = datetime.now()
+            self.config.update_expiry_deadline()
             
             # Update session headers
             self._setup_session_headers()
             
-            print("✓ Token refreshed successfully")
+            logger.info("Token refreshed successfully")
             return token_data
             
         except requests.exceptions.RequestException as e:
             error_msg = f"Token refresh failed: {e}"
             if hasattr(e, 'response') and e.response:
                 error_msg += f"\nResponse: {e.response.text}"
-            print(f"❌ {error_msg}")
+            logger.error(error_msg)
             raise Exception(error_msg)
     
+    def _schedule_refresh(self, delay: Optional[float] = None):
+        """
+        Schedule a background token refresh.
+        
+        Args:
+            delay: Seconds until refresh; defaults to the token's 5-minute-early expiry deadline
+        """
+        if delay is None:
+            delay = self.config.seconds_until_expiry()
+        
+        self._refresh_timer = threading.Timer(delay, self._background_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+    
+    def _background_refresh(self):
+        """Refresh the token from the timer thread and reschedule the next refresh."""
+        try:
+            self.refresh_token()
+        except Exception as e:
+            logger.warning("Background token refresh failed, retrying in 60 seconds: %s", e)
+            self._schedule_refresh(60)
+            return
+        
+        self._schedule_refresh()
+    
+    def close(self):
+        """
+        Stop background token refresh and release pooled connections.
+        
+        The client can also be used as a context manager, which calls this on exit.
+        """
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def create_instant_criminal_check(self,
                                     first_name: str,
                                     last_name: str,
@@ -281,57 +587,94 @@ class CheckrAPIClient:
             Complete API response with check results
         """
         
-        # Build the request payload according to API documentation
-        check_data = {
-            "first_name": first_name.strip(),
-            "last_name": last_name.strip()
-        }
+        check_data = self._build_check_payload({
+            "first_name": first_name,
+            "last_name": last_name,
+            "dob": dob,
+            "middle_name": middle_name,
+            "ssn": ssn,
+            "email": email,
+            "phone": phone,
+            "address": address,
+            "reference_id": reference_id
+        })
         
-        # Add optional fields if provided
-        if middle_name:
-            check_data["middle_name"] = middle_name.strip()
+        logger.debug("Creating instant criminal check for: %s %s", first_name, last_name)
         
-        if dob:
-            # Convert date to YYYYMMDD format required by API
-            check_data["dob"] = self._format_date(dob)
+        # Make API request - Checkr Trust API returns results immediately for instant checks
+        response = self._make_request("POST", "/v1/checks", check_data, url=self._checks_url)
         
-        if ssn:
-            check_data["ssn"] = ssn.strip()
+        check_id = response.get("id")
+        if check_id:
+            logger.debug("Check created with ID: %s", check_id)
         
-        if email:
-            check_data["email"] = email.strip()
+        return response
+    
+    async def create_instant_criminal_checks_bulk(self,
+                                                  persons: List[Dict[str, Any]],
+                                                  concurrency: int = 10) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Create instant criminal checks for many people concurrently.
         
-        if phone:
-            check_data["phone"] = phone.strip()
+        Requests are multiplexed over a shared HTTP/2 connection pool, with at
+        most `concurrency` checks in flight at once. Requires httpx[http2].
         
-        if address:
-            # Format address according to API documentation
-            address_data = {}
-            if address.get("street"):
-                address_data["street"] = address["street"].strip()
-            if address.get("city"):
-                address_data["city"] = address["city"].strip()
-            if address.get("state"):
-                address_data["state"] = address["state"].strip()
-            if address.get("zip_code"):
-                address_data["zip_code"] = address["zip_code"].strip()
+        429/5xx responses are retried with backoff, honouring Retry-After, under
+        one Idempotency-Key per person. A request that still fails does not
+        abort the batch: its exception is returned in that person's slot, so
+        checks already created are kept.
+        
+        Args:
+            persons: List of dicts with the same keys as create_instant_criminal_check's arguments
+            concurrency: Maximum number of simultaneous requests
             
-            if address_data:  # Only add if we have address data
-                check_data["address"] = address_data
+        Returns:
+            API responses (or the Exception for a failed request) in the same order as `persons`
+        """
+        import httpx
         
-        if reference_id:
-            check_data["reference_id"] = reference_id.strip()
+        self._validate_token()
         
-        print(f"🔍 Creating instant criminal check for: {first_name} {last_name}")
+        url = self._checks_url
+        headers = {
+            key: self.session.headers[key]
+            for key in ("Authorization", "Content-Type", "Accept", "User-Agent")
+        }
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
         
-        # Make API request - Checkr Trust API returns results immediately for instant checks
-        response = self._make_request("POST", "/v1/checks", check_data)
+        logger.debug("Creating %d instant criminal checks (concurrency=%d)", len(persons), concurrency)
         
-        check_id = response.get("id")
-        if check_id:
-            print(f"✓ Check created with ID: {check_id}")
+        async with httpx.AsyncClient(http2=True, limits=limits, headers=headers, timeout=30.0) as client:
+            
+            async def submit(person: Dict[str, Any]) -> Dict[str, Any]:
+                check_data = self._build_check_payload(person)
+                request_headers = {"Idempotency-Key": str(uuid.uuid4())}
+                async with semaphore:
+                    for attempt in range(_BULK_MAX_RETRIES + 1):
+                        delay = self._bucket.reserve()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                        try:
+                            response = await client.post(url, json=check_data, headers=request_headers)
+                        except httpx.HTTPError as e:
+                            raise Exception(f"Request failed: {e}")
+                        
+                        if response.status_code in _BULK_RETRY_STATUSES and attempt < _BULK_MAX_RETRIES:
+                            await asyncio.sleep(_retry_delay(response.headers.get("Retry-After"), attempt))
+                            continue
+                        
+                        try:
+                            response.raise_for_status()
+                        except httpx.HTTPStatusError as e:
+                            raise Exception(f"HTTP {e.response.status_code}: {e}\nResponse Text: {e.response.text}")
+                        return response.json()
+            
+            results = await asyncio.gather(*(submit(person) for person in persons), return_exceptions=True)
         
-        return response
+        failed = sum(isinstance(result, Exception) for result in results)
+        logger.debug("Created %d check(s), %d failed", len(results) - failed, failed)
+        return list(results)
     
     def get_check_status(self, check_id: str) -> Dict[str, Any]:
         """
@@ -340,14 +683,97 @@ class CheckrAPIClient:
         Args:
             check_id: The ID of the check to retrieve
             
+        Completed checks are served from a bounded in-process cache for
+        status_cache_ttl seconds, and concurrent lookups of the same check
+        share a single request. Each caller gets its own copy of the data.
+        
         Returns:
             Check data and results
         """
-        print(f"📊 Getting check: {check_id}")
+        with self._status_lock:
+            cached = self._status_cache.get(check_id)
+            if cached and time.monotonic() - cached[0] < self.status_cache_ttl:
+                self._status_cache.move_to_end(check_id)
+                return copy.deepcopy(cached[1])
+            
+            future = self._status_inflight.get(check_id)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._status_inflight[check_id] = future
         
-        response = self._make_request("GET", f"/v1/checks/{check_id}")
+        if not is_owner:
+            return copy.deepcopy(future.result())
         
-        return response
+        logger.debug("Getting check: %s", check_id)
+        
+        try:
+            response = self._make_request("GET", "/v1/checks/", url=self._checks_get_prefix + check_id)
+            if response.get("completed_at"):
+                with self._status_lock:
+                    self._status_cache[check_id] = (time.monotonic(), response)
+                    self._status_cache.move_to_end(check_id)
+                    if len(self._status_cache) > self.STATUS_CACHE_SIZE:
+                        self._status_cache.popitem(last=False)
+            future.set_result(response)
+            return copy.deepcopy(response)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._status_lock:
+                self._status_inflight.pop(check_id, None)
+    
+    def get_check_summary(self, check_id: str) -> Dict[str, int]:
+        """
+        Count the cases in each result category of a background check.
+        
+        Large responses are parsed incrementally with ijson (when installed)
+        so the full case list is never held in memory at once.
+        
+        Args:
+            check_id: The ID of the check to summarize
+            
+        Returns:
+            Mapping of result category to number of cases
+        """
+        self._validate_token()
+        self._bucket.acquire()
+        
+        logger.debug("Summarizing check: %s", check_id)
+        
+        try:
+            response = self.session.get(self._checks_get_prefix + check_id, stream=True)
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Request failed: {e}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+        
+        with response:
+            content_length = int(response.headers.get("Content-Length") or 0)
+            if response.ok and content_length > _STREAM_PARSE_THRESHOLD:
+                try:
+                    import ijson
+                except ImportError:
+                    ijson = None
+                
+                if ijson is not None:
+                    # Let urllib3 undo gzip/br before ijson sees the bytes
+                    response.raw.decode_content = True
+                    return self._count_cases(ijson.items(response.raw, "results.item"))
+            
+            data = self._parse_response(response)
+        
+        return self._count_cases(data.get("results", []))
+    
+    @staticmethod
+    def _count_cases(results: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Tally cases per category over an iterable of check result entries."""
+        summary: Dict[str, int] = {}
+        for result in results:
+            category = result.get("category", "Unknown")
+            summary[category] = summary.get(category, 0) + len(result.get("cases", []))
+        return summary
     
     def run_instant_criminal_check(self,
                                  first_name: str,
@@ -380,7 +806,7 @@ class CheckrAPIClient:
             Complete check results
         """
         
-        print("🚀 Starting instant criminal check workflow")
+        logger.debug("Starting instant criminal check workflow")
         
         # Create the check - results are returned immediately
         results = self.create_instant_criminal_check(
@@ -395,7 +821,41 @@ class CheckrAPIClient:
             reference_id=reference_id
         )
         
-        print("✓ Instant criminal check completed")
+        logger.debug("Instant criminal check completed")
+        return results
+    
+    def run_instant_criminal_checks(self, persons: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run instant criminal checks for several people sequentially.
+        
+        The token is validated once up front and every check is posted over
+        the session's keep-alive connection without per-call dispatch.
+        
+        Args:
+            persons: Dicts with the same keys as run_instant_criminal_check's arguments
+            
+        Returns:
+            Check results in the same order as `persons`
+        """
+        self._validate_token()
+        
+        url = self._checks_url
+        post = self.session.post
+        acquire = self._bucket.acquire
+        results = []
+        
+        for person in persons:
+            body = _json_dumps(self._build_check_payload(person))
+            acquire()
+            try:
+                response = post(url, data=body)
+            except requests.exceptions.RequestException as e:
+                error_msg = f"Request failed: {e}"
+                logger.error(error_msg)
+                raise Exception(error_msg)
+            results.append(self._parse_response(response))
+        
+        logger.debug("Completed %d instant criminal check(s)", len(results))
         return results
     
     def get_token_info(self) -> Dict[str, Any]:
@@ -423,6 +883,8 @@ class CheckrAPIClient:
 def main():
     """Main function demonstrating the Checkr API client usage."""
     
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    
     try:
         print("=" * 70)
         print("CHECKR TRUST INSTANT CRIMINAL CHECK API CLIENT")
@@ -524,7 +986,9 @@ def main():
             "expires_in": 86400,
             "token_type": "Bearer",
             "client_id": "your_client_id_here",
-            "client_secret": "your_client_secret_here"
+            "client_secret": "your_client_secret_here",
+            "rate_per_sec": 10,
+            "burst": 20
         }
         print(json.dumps(example_config, indent=2))
         
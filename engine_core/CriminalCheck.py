@@ -1,9 +1,17 @@
+import functools
 import json
+import sys
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 class RiskLevel(Enum):
     IGNORED = "Ignored"
     LOW = "Low"
@@ -11,7 +19,7 @@ class RiskLevel(Enum):
     HIGH = "High"
     CLEAN = "Clean"
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedCase:
     case_number: str
     charge_description: str
@@ -24,274 +32,306 @@ class ProcessedCase:
     risk_score: float
     reason: str
     
+class ProcessedResults(dict):
+    """Cases keyed by risk level, plus aggregates tracked while they were built."""
+    highest_risk_score: float = 0.0
+    
+def _clean_case() -> ProcessedCase:
+    """Build the Clean case returned when a payload has no results at all.
+    
+    A fresh instance per call, so annotating one result never changes another.
+    """
+    return ProcessedCase(
+        case_number="N/A",
+        charge_description="No criminal records found",
+        offense_date="N/A",
+        charge_type="N/A",
+        disposition="N/A",
+        category="N/A",
+        subcategory="N/A",
+        risk_level=RiskLevel.CLEAN,
+        risk_score=0.0,
+        reason="No criminal history found"
+    )
+
+# This is a simplified mapping based on the CSV data analysis
+# You should load this from the actual CSV files for production use
+_CSV_RISK_MAPPING = {
+    # Vehicles & Traffic category mappings
+    ("vehicles & traffic", "license"): "High",
+    ("vehicles & traffic", "license & registration"): "High",
+    ("vehicles & traffic", "speeding"): "Low",
+    ("vehicles & traffic", "traffic violations"): "Low",
+    ("vehicles & traffic", "reckless driving"): "Med",
+    
+    # Other categories
+    ("criminal intent", "accessory"): "Low",
+    ("criminal intent", "court orders"): "Med",
+    ("violence", ""): "High",
+    ("sexual", ""): "High",
+    ("homicide", ""): "High",
+    ("fraud & deception", ""): "Med",
+    ("drugs & alcohol", ""): "Med",
+    ("theft & property", ""): "Med",
+    ("security", ""): "High",
+    ("statutory", ""): "Low",
+    ("unclassified", ""): "High"
+}
+
+_HIGH_RISK_CATEGORIES = frozenset(["violence", "sexual", "homicide", "security", "unclassified"])
+
+# Base score for each CSV risk level
+_RISK_BASE_SCORES = {
+    "High": 30,
+    "Med": 15,
+    "Low": 5,
+    "Unscored": 10
+}
+
+# Score multiplier for each disposition risk impact
+_IMPACT_MULTIPLIERS = {"high": 1.5, "medium": 1.2, "low": 1.0, "none": 0.5}
+
+# Recency factor by days since offense: <=1, <=3, <=5 years (of 365 days), older
+_RECENCY_DAY_BOUNDS = (365, 3 * 365, 5 * 365)
+_RECENCY_FACTORS = (1.5, 1.2, 1.0, 0.8)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_yyyymmdd(date_str: str) -> datetime:
+    """Parse a YYYYMMDD string; cached since charges in a payload often share dates."""
+    # Fixed-width slicing avoids strptime's format interpreter for the usual
+    # 8-digit form; anything else (e.g. "2020011") gets strptime's looser parse
+    if len(date_str) == 8 and date_str.isascii() and date_str.isdigit():
+        return datetime(int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8]))
+    return datetime.strptime(date_str, "%Y%m%d")
+
 class CriminalCheckProcessor:
     def __init__(self, config_file_path: str = "config.json"):
         """Initialize the processor with configuration from JSON file."""
         self.config = self._load_config(config_file_path)
         self.lookback_years = self.config["search_parameters"]["lookback_period"]["selected_period"]
         self.cutoff_date = datetime.now() - timedelta(days=self.lookback_years * 365)
+        self._lookback_reason = f"Outside {self.lookback_years}-year lookback period"
+        # Offense dates are midnight, so they fall inside the lookback iff their
+        # ordinal is at least that of the first midnight on or after cutoff_date
+        self._cutoff_ordinal = self.cutoff_date.toordinal()
+        if self.cutoff_date.time() != datetime.min.time():
+            self._cutoff_ordinal += 1
+        self._today_ordinal = datetime.now().toordinal()
+        self._build_lookup_tables()
+        
+        # Ascending threshold mins; bisect_right counts how many a score reaches
+        thresholds = self.config["scoring_rules"]["thresholds"]
+        self._threshold_mins = tuple(
+            thresholds[name]["min"] for name in ("low_risk", "medium_risk", "high_risk", "critical_risk")
+        )
+        self._threshold_levels = (RiskLevel.LOW, RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.HIGH)
+        self._lc_cache: Dict[str, str] = {}
+        self._score_factor_cache: Dict[Tuple[str, str, str, str], float] = {}
         
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from JSON file."""
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                raw = f.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         except json.JSONDecodeError:
             raise ValueError(f"Invalid JSON in configuration file: {config_path}")
     
+    def _build_lookup_tables(self):
+        """Index the config lists by casefolded key so each lookup is a single dict.get()."""
+        
+        def index(items: List[Dict[str, Any]], key_field: str, value_field: str) -> Dict[str, Any]:
+            table = {}
+            for item in items:
+                # First entry wins, matching the order a linear scan would find
+                table.setdefault(sys.intern(item[key_field].casefold()), item[value_field])
+            return table
+        
+        record_categories = self.config["record_categories"]["categories"]
+        charge_types = self.config["charge_classification"]["types"]
+        dispositions = self.config["disposition_filters"]["dispositions"]
+        risk_categories = self.config["risk_scoring"]["categories"]
+        
+        self._enabled_record_cats = frozenset(
+            category for category, enabled in index(record_categories, "category", "enabled").items() if enabled
+        )
+        self._charge_type_enabled = index(charge_types, "input_key", "enabled")
+        self._charge_type_weight = index(charge_types, "input_key", "severity_weight")
+        self._disposition_enabled = index(dispositions, "input_key", "enabled")
+        self._disposition_impact = index(dispositions, "input_key", "risk_impact")
+        self._risk_cat_weight = index(risk_categories, "category", "base_weight")
+    
+    def _lc(self, value: str) -> str:
+        """Return the casefolded, interned form of a payload string, cached per input."""
+        lowered = self._lc_cache.get(value)
+        if lowered is None:
+            lowered = self._lc_cache[value] = sys.intern(value.casefold())
+        return lowered
+    
     def _parse_date(self, date_str: str) -> datetime:
         """Parse date string in YYYYMMDD format."""
         try:
-            return datetime.strptime(date_str, "%Y%m%d")
+            return _parse_yyyymmdd(date_str)
         except ValueError:
             raise ValueError(f"Invalid date format: {date_str}. Expected YYYYMMDD.")
     
-    def _is_within_lookback(self, offense_date: str) -> bool:
-        """Check if offense date is within the configured lookback period."""
-        try:
-            offense_dt = self._parse_date(offense_date)
-            return offense_dt >= self.cutoff_date
-        except ValueError:
-            return False
+    def _is_within_lookback(self, offense_dt: datetime) -> bool:
+        """Check if a parsed offense date is within the configured lookback period."""
+        return offense_dt.toordinal() >= self._cutoff_ordinal
     
     def _is_record_category_enabled(self, category: str) -> bool:
         """Check if the record category is enabled in configuration."""
-        categories = self.config["record_categories"]["categories"]
-        for cat in categories:
-            if cat["category"].lower() == category.lower():
-                return cat["enabled"]
-        return False
+        return self._lc(category) in self._enabled_record_cats
     
     def _is_charge_type_enabled(self, charge_type: str) -> bool:
         """Check if the charge type is enabled in configuration."""
-        charge_types = self.config["charge_classification"]["types"]
-        for ct in charge_types:
-            if ct["input_key"].lower() == charge_type.lower():
-                return ct["enabled"]
-        return False
+        return self._charge_type_enabled.get(self._lc(charge_type), False)
     
     def _is_disposition_enabled(self, disposition: str) -> bool:
         """Check if the disposition type is enabled in configuration."""
-        dispositions = self.config["disposition_filters"]["dispositions"]
-        for disp in dispositions:
-            if disp["input_key"].lower() == disposition.lower():
-                return disp["enabled"]
-        return False
+        return self._disposition_enabled.get(self._lc(disposition), False)
     
     def _get_risk_category_weight(self, category: str) -> float:
         """Get the base weight for a risk category."""
-        risk_categories = self.config["risk_scoring"]["categories"]
-        for cat in risk_categories:
-            if cat["category"].lower() == category.lower():
-                return cat["base_weight"]
-        return 1.0  # Default weight
+        return self._risk_cat_weight.get(self._lc(category), 1.0)  # Default weight
     
     def _get_charge_type_weight(self, charge_type: str) -> int:
         """Get the severity weight for a charge type."""
-        charge_types = self.config["charge_classification"]["types"]
-        for ct in charge_types:
-            if ct["input_key"].lower() == charge_type.lower():
-                return ct["severity_weight"]
-        return 1  # Default weight
+        return self._charge_type_weight.get(self._lc(charge_type), 1)  # Default weight
     
     def _get_disposition_risk_impact(self, disposition: str) -> str:
         """Get the risk impact level for a disposition."""
-        dispositions = self.config["disposition_filters"]["dispositions"]
-        for disp in dispositions:
-            if disp["input_key"].lower() == disposition.lower():
-                return disp["risk_impact"]
-        return "low"  # Default impact
+        return self._disposition_impact.get(self._lc(disposition), "low")  # Default impact
     
     def _get_csv_risk_score(self, category: str, subcategory: str) -> str:
         """Get risk score from CSV data based on category and subcategory."""
-        # This is a simplified mapping based on the CSV data analysis
-        # You should load this from the actual CSV files for production use
-        
-        risk_mapping = {
-            # Vehicles & Traffic category mappings
-            ("vehicles & traffic", "license"): "High",
-            ("vehicles & traffic", "license & registration"): "High", 
-            ("vehicles & traffic", "speeding"): "Low",
-            ("vehicles & traffic", "traffic violations"): "Low",
-            ("vehicles & traffic", "reckless driving"): "Med",
-            
-            # Other categories
-            ("criminal intent", "accessory"): "Low",
-            ("criminal intent", "court orders"): "Med",
-            ("violence", ""): "High",
-            ("sexual", ""): "High",
-            ("homicide", ""): "High",
-            ("fraud & deception", ""): "Med",
-            ("drugs & alcohol", ""): "Med",
-            ("theft & property", ""): "Med",
-            ("security", ""): "High",
-            ("statutory", ""): "Low",
-            ("unclassified", ""): "High"
-        }
-        
-        # Try exact match first
-        key = (category.lower(), subcategory.lower())
-        if key in risk_mapping:
-            return risk_mapping[key]
-        
-        # Try category-only match
-        key = (category.lower(), "")
-        if key in risk_mapping:
-            return risk_mapping[key]
-        
-        # Default based on category
-        high_risk_categories = ["violence", "sexual", "homicide", "security", "unclassified"]
-        if category.lower() in high_risk_categories:
-            return "High"
+        category = self._lc(category)
         
-        return "Med"  # Default to medium risk
+        # Try exact match first, then category-only match, then default by category
+        return (_CSV_RISK_MAPPING.get((category, self._lc(subcategory)))
+                or _CSV_RISK_MAPPING.get((category, ""))
+                or ("High" if category in _HIGH_RISK_CATEGORIES else "Med"))
 
-    def _calculate_risk_score(self, charge: Dict[str, Any], offense_date: str) -> float:
+    def _calculate_risk_score(self, charge: Dict[str, Any], offense_dt: datetime,
+                              disposition: str) -> float:
         """Calculate risk score for a charge based on CSV risk data and configuration."""
         category = charge.get("category", "Unclassified")
         subcategory = charge.get("subcategory", "")
+        charge_type = charge.get("type", "unknown")
+        
+        # Everything but recency depends only on these four fields, and payloads
+        # repeat a handful of combinations, so compute each combination once
+        key = (category, subcategory, charge_type, disposition)
+        final_score = self._score_factor_cache.get(key)
+        if final_score is None:
+            final_score = self._score_factor_cache[key] = self._calculate_score_factor(
+                category, subcategory, charge_type, disposition
+            )
         
+        # Apply recency factor; whole days compare exactly against the day bounds
+        days_ago = self._today_ordinal - offense_dt.toordinal()
+        final_score *= _RECENCY_FACTORS[bisect_left(_RECENCY_DAY_BOUNDS, days_ago)]
+        
+        return round(final_score, 2)
+    
+    def _calculate_score_factor(self, category: str, subcategory: str,
+                                charge_type: str, disposition: str) -> float:
+        """Calculate the recency-independent part of a charge's risk score."""
         # Get risk level from CSV data
         csv_risk_level = self._get_csv_risk_score(category, subcategory)
         
         # Convert CSV risk level to base score
-        risk_base_scores = {
-            "High": 30,
-            "Med": 15, 
-            "Low": 5,
-            "Unscored": 10
-        }
-        
-        base_score = risk_base_scores.get(csv_risk_level, 15)
+        base_score = _RISK_BASE_SCORES.get(csv_risk_level, 15)
         
         # Special handling for unclassified
-        if category.lower() == "unclassified":
+        if self._lc(category) == "unclassified":
             base_score = 35  # Even higher for unclassified
         
         # Get charge type weight multiplier
-        charge_type = charge.get("type", "unknown")
         charge_weight = self._get_charge_type_weight(charge_type)
         
         # Get disposition impact multiplier
-        disposition = charge.get("dispositions", [{}])[0].get("disposition_type", "unknown")
         disposition_impact = self._get_disposition_risk_impact(disposition)
         
         # Apply multipliers
-        impact_multipliers = {"high": 1.5, "medium": 1.2, "low": 1.0, "none": 0.5}
-        disposition_multiplier = impact_multipliers.get(disposition_impact, 1.0)
-        
-        # Calculate final score
-        final_score = base_score * (charge_weight / 2) * disposition_multiplier
-        
-        # Apply recency factor
-        try:
-            offense_dt = self._parse_date(offense_date)
-            years_ago = (datetime.now() - offense_dt).days / 365
-            
-            if years_ago <= 1:
-                recency_factor = 1.5
-            elif years_ago <= 3:
-                recency_factor = 1.2
-            elif years_ago <= 5:
-                recency_factor = 1.0
-            else:
-                recency_factor = 0.8
-                
-            final_score *= recency_factor
-        except ValueError:
-            pass  # Use base score without recency adjustment
+        disposition_multiplier = _IMPACT_MULTIPLIERS.get(disposition_impact, 1.0)
         
-        return round(final_score, 2)
+        return base_score * (charge_weight / 2) * disposition_multiplier
     
     def _determine_risk_level(self, risk_score: float, category: str) -> RiskLevel:
         """Determine risk level based on score and category."""
-        if category.lower() == "unclassified" and risk_score > 0:
+        if self._lc(category) == "unclassified" and risk_score > 0:
             return RiskLevel.HIGH
         
-        thresholds = self.config["scoring_rules"]["thresholds"]
-        
-        if risk_score >= thresholds["critical_risk"]["min"]:
-            return RiskLevel.HIGH
-        elif risk_score >= thresholds["high_risk"]["min"]:
-            return RiskLevel.HIGH
-        elif risk_score >= thresholds["medium_risk"]["min"]:
-            return RiskLevel.MEDIUM
-        elif risk_score >= thresholds["low_risk"]["min"]:
-            return RiskLevel.LOW
-        else:
-            return RiskLevel.LOW
+        return self._threshold_levels[bisect_right(self._threshold_mins, risk_score)]
+    
+    def _make_ignored(self, charge: Dict[str, Any], case_number: str, offense_date: str,
+                      charge_type: str, disposition: str, reason: str) -> ProcessedCase:
+        """Build the ProcessedCase for a charge filtered out before scoring."""
+        return ProcessedCase(
+            case_number=case_number,
+            charge_description=charge.get("description", ""),
+            offense_date=offense_date,
+            charge_type=charge_type,
+            disposition=disposition,
+            category=charge.get("category", "unclassified"),
+            subcategory=charge.get("subcategory", ""),
+            risk_level=RiskLevel.IGNORED,
+            risk_score=0.0,
+            reason=reason
+        )
     
     def _process_charge(self, charge: Dict[str, Any], case_number: str) -> Tuple[ProcessedCase, bool]:
         """Process a single charge and return ProcessedCase and whether it should be included."""
         offense_date = charge.get("offense_date", "")
         charge_type = charge.get("type", "unknown")
-        category = charge.get("category", "unclassified")
-        subcategory = charge.get("subcategory", "")
-        description = charge.get("description", "")
-        disposition = charge.get("dispositions", [{}])[0].get("disposition_type", "unknown")
+        dispositions = charge.get("dispositions")
+        disposition = dispositions[0].get("disposition_type", "unknown") if dispositions else "unknown"
+        
+        # Parse the offense date once; unparseable dates count as outside the lookback
+        try:
+            offense_dt = self._parse_date(offense_date)
+        except ValueError:
+            offense_dt = None
         
         # Check if within lookback period
-        if not self._is_within_lookback(offense_date):
-            processed_case = ProcessedCase(
-                case_number=case_number,
-                charge_description=description,
-                offense_date=offense_date,
-                charge_type=charge_type,
-                disposition=disposition,
-                category=category,
-                subcategory=subcategory,
-                risk_level=RiskLevel.IGNORED,
-                risk_score=0.0,
-                reason=f"Outside {self.lookback_years}-year lookback period"
-            )
-            return processed_case, False
+        if offense_dt is None or not self._is_within_lookback(offense_dt):
+            return self._make_ignored(
+                charge, case_number, offense_date, charge_type, disposition,
+                self._lookback_reason
+            ), False
         
         # Check if charge type is enabled
         if not self._is_charge_type_enabled(charge_type):
-            processed_case = ProcessedCase(
-                case_number=case_number,
-                charge_description=description,
-                offense_date=offense_date,
-                charge_type=charge_type,
-                disposition=disposition,
-                category=category,
-                subcategory=subcategory,
-                risk_level=RiskLevel.IGNORED,
-                risk_score=0.0,
-                reason=f"Charge type '{charge_type}' not enabled in configuration"
-            )
-            return processed_case, False
+            return self._make_ignored(
+                charge, case_number, offense_date, charge_type, disposition,
+                f"Charge type '{charge_type}' not enabled in configuration"
+            ), False
         
         # Check if disposition is enabled
         if not self._is_disposition_enabled(disposition):
-            processed_case = ProcessedCase(
-                case_number=case_number,
-                charge_description=description,
-                offense_date=offense_date,
-                charge_type=charge_type,
-                disposition=disposition,
-                category=category,
-                subcategory=subcategory,
-                risk_level=RiskLevel.IGNORED,
-                risk_score=0.0,
-                reason=f"Disposition '{disposition}' not enabled in configuration"
-            )
-            return processed_case, False
+            return self._make_ignored(
+                charge, case_number, offense_date, charge_type, disposition,
+                f"Disposition '{disposition}' not enabled in configuration"
+            ), False
+        
+        category = charge.get("category", "unclassified")
         
         # Calculate risk score and determine level
-        risk_score = self._calculate_risk_score(charge, offense_date)
+        risk_score = self._calculate_risk_score(charge, offense_dt, disposition)
         risk_level = self._determine_risk_level(risk_score, category)
         
         processed_case = ProcessedCase(
             case_number=case_number,
-            charge_description=description,
+            charge_description=charge.get("description", ""),
             offense_date=offense_date,
             charge_type=charge_type,
             disposition=disposition,
             category=category,
-            subcategory=subcategory,
+            subcategory=charge.get("subcategory", ""),
             risk_level=risk_level,
             risk_score=risk_score,
             reason="Processed successfully"
@@ -299,7 +339,7 @@ class CriminalCheckProcessor:
         
         return processed_case, True
     
-    def process_criminal_check(self, data: Dict[str, Any]) -> Dict[str, List[ProcessedCase]]:
+    def process_criminal_check(self, data: Dict[str, Any]) -> ProcessedResults:
         """
         Process criminal check data and categorize cases by risk level.
         
@@ -309,37 +349,42 @@ class CriminalCheckProcessor:
         Returns:
             Dictionary with risk levels as keys and lists of ProcessedCase as values
         """
-        results = {
-            "Ignored": [],
-            "Low": [],
-            "Medium": [],
-            "High": [],
-            "Clean": []
-        }
-        
         # Check if input data has results
-        if "results" not in data or not data["results"]:
-            results["Clean"].append(ProcessedCase(
-                case_number="N/A",
-                charge_description="No criminal records found",
-                offense_date="N/A",
-                charge_type="N/A",
-                disposition="N/A",
-                category="N/A",
-                subcategory="N/A",
-                risk_level=RiskLevel.CLEAN,
-                risk_score=0.0,
-                reason="No criminal history found"
-            ))
-            return results
+        if not data.get("results"):
+            return ProcessedResults(
+                Ignored=[],
+                Low=[],
+                Medium=[],
+                High=[],
+                Clean=[_clean_case()]
+            )
+        
+        results = ProcessedResults(
+            Ignored=[],
+            Low=[],
+            Medium=[],
+            High=[],
+            Clean=[]
+        )
         
         processed_any = False
+        highest_risk_score = 0.0
+        self._today_ordinal = datetime.now().toordinal()
+        
+        # Bind per-charge callables once rather than resolving them on self each time
+        lc = self._lc
+        enabled_record_cats = self._enabled_record_cats
+        process_charge = self._process_charge
+        # Keyed by RiskLevel member so binning skips the Enum .value descriptor;
+        # the returned dict keeps its string keys for callers and JSON export
+        appenders = {RiskLevel(level): cases.append for level, cases in results.items()}
+        append_ignored = appenders[RiskLevel.IGNORED]
         
         for result in data["results"]:
             category = result.get("category", "")
             
             # Check if record category is enabled
-            if not self._is_record_category_enabled(category):
+            if lc(category) not in enabled_record_cats:
                 continue
                 
             cases = result.get("cases", [])
@@ -348,15 +393,20 @@ class CriminalCheckProcessor:
                 charges = case.get("charges", [])
                 
                 for charge in charges:
-                    processed_case, should_include = self._process_charge(charge, case_number)
+                    processed_case, should_include = process_charge(charge, case_number)
                     
-                    if processed_case.risk_level == RiskLevel.IGNORED:
-                        results["Ignored"].append(processed_case)
+                    risk_level = processed_case.risk_level
+                    if risk_level is RiskLevel.IGNORED:
+                        append_ignored(processed_case)
                     else:
-                        results[processed_case.risk_level.value].append(processed_case)
+                        appenders[risk_level](processed_case)
+                        if processed_case.risk_score > highest_risk_score:
+                            highest_risk_score = processed_case.risk_score
                         if should_include:
                             processed_any = True
         
+        results.highest_risk_score = highest_risk_score
+        
         # If no cases were processed (all ignored) and no active cases, mark as clean
         if not processed_any and not any(results[level] for level in ["Low", "Medium", "High"]):
             if not results["Ignored"]:  # Only if nothing was ignored either
@@ -384,9 +434,14 @@ class CriminalCheckProcessor:
             "recommendations": []
         }
         
+        # Results built by process_criminal_check already carry their highest score
+        tracked = isinstance(processed_results, ProcessedResults)
+        if tracked:
+            summary["highest_risk_score"] = processed_results.highest_risk_score
+        
         for risk_level, cases in processed_results.items():
             summary["risk_distribution"][risk_level] = len(cases)
-            if cases:
+            if cases and not tracked:
                 max_score = max(case.risk_score for case in cases)
                 summary["highest_risk_score"] = max(summary["highest_risk_score"], max_score)
         
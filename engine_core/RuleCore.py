@@ -1,14 +1,58 @@
+import asyncio
+import functools
 import json
+import logging
+import operator
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple, Union
+from dataclasses import dataclass, fields
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 # Import the existing classes
 from CheckrAPI import CheckrAPIClient
 from CriminalCheck import CriminalCheckProcessor, ProcessedCase, RiskLevel
 
+# ProcessedCase fields in declaration order, read in one call for the stdlib export
+_CASE_FIELDS = tuple(field.name for field in fields(ProcessedCase))
+_case_getter = operator.attrgetter(*_CASE_FIELDS)
+
+# Result levels from most to least severe, for deriving the overall risk
+_RISK_PRECEDENCE = (("High", RiskLevel.HIGH), ("Medium", RiskLevel.MEDIUM), ("Low", RiskLevel.LOW))
+
+@functools.lru_cache(maxsize=256)
+def _recommendation_text(overall_risk: RiskLevel, high_count: int, medium_count: int,
+                         low_count: int, ignored_count: int) -> str:
+    """Format the recommendation for a risk level and case counts; batches repeat these."""
+    if overall_risk == RiskLevel.HIGH:
+        return (f"REJECT - High risk profile identified. {high_count} high-risk case(s) "
+               f"require immediate review and likely disqualification.")
+    
+    elif overall_risk == RiskLevel.MEDIUM:
+        return (f"REVIEW REQUIRED - Medium risk profile. {medium_count} case(s) need "
+               f"manual review before making a decision.")
+    
+    elif overall_risk == RiskLevel.LOW:
+        return (f"CONDITIONAL APPROVAL - Low risk profile. {low_count} minor case(s) "
+               f"identified but may be acceptable depending on role requirements.")
+    
+    elif overall_risk == RiskLevel.CLEAN:
+        if ignored_count > 0:
+            return (f"APPROVE - Clean background check. {ignored_count} case(s) were "
+                   f"outside assessment criteria.")
+        else:
+            return "APPROVE - Clean background check with no concerning records found."
+    
+    else:
+        return "MANUAL REVIEW - Unable to determine risk level automatically."
+
 @dataclass
 class RuleEngineResult:
     """Complete result from the rule engine including API data and risk assessment."""
@@ -32,6 +76,9 @@ class CriminalBackgroundRuleEngine:
     
     This engine handles the complete workflow from API calls to risk categorization
     based on configurable business rules.
+    
+    Reuse one engine for many checks: its API client keeps pooled keep-alive
+    connections to Checkr, so later checks skip the TCP/TLS handshake.
     """
     
     def __init__(self, 
@@ -49,13 +96,13 @@ class CriminalBackgroundRuleEngine:
         # Initialize both components
         try:
             self.api_client = CheckrAPIClient(checkr_config_path)
-            print("✓ Checkr API client initialized")
+            logger.info("✓ Checkr API client initialized")
         except Exception as e:
             raise RuleEngineError(f"Failed to initialize Checkr API client: {e}")
         
         try:
             self.risk_processor = CriminalCheckProcessor(risk_config_path)
-            print("✓ Risk assessment processor initialized")
+            logger.info("✓ Risk assessment processor initialized")
         except Exception as e:
             raise RuleEngineError(f"Failed to initialize risk processor: {e}")
     
@@ -69,29 +116,12 @@ class CriminalBackgroundRuleEngine:
         Returns:
             Overall risk level for the person
         """
-        # If any high risk cases, overall is high
-        if processed_cases.get("High"):
-            return RiskLevel.HIGH
-        
-        # If any medium risk cases, overall is medium
-        if processed_cases.get("Medium"):
-            return RiskLevel.MEDIUM
+        # The most severe level with any cases wins
+        for level_name, risk_level in _RISK_PRECEDENCE:
+            if processed_cases.get(level_name):
+                return risk_level
         
-        # If any low risk cases, overall is low
-        if processed_cases.get("Low"):
-            return RiskLevel.LOW
-        
-        # If only ignored cases, consider as clean
-        if processed_cases.get("Ignored") and not any(
-            processed_cases.get(level) for level in ["High", "Medium", "Low"]
-        ):
-            return RiskLevel.CLEAN
-        
-        # If clean results
-        if processed_cases.get("Clean"):
-            return RiskLevel.CLEAN
-        
-        # Default to clean if no cases
+        # Only ignored cases, clean results, or no cases at all: consider as clean
         return RiskLevel.CLEAN
     
     def _generate_recommendation(self, 
@@ -107,32 +137,13 @@ class CriminalBackgroundRuleEngine:
         Returns:
             Recommendation string
         """
-        high_count = len(processed_cases.get("High", []))
-        medium_count = len(processed_cases.get("Medium", []))
-        low_count = len(processed_cases.get("Low", []))
-        ignored_count = len(processed_cases.get("Ignored", []))
-        
-        if overall_risk == RiskLevel.HIGH:
-            return (f"REJECT - High risk profile identified. {high_count} high-risk case(s) "
-                   f"require immediate review and likely disqualification.")
-        
-        elif overall_risk == RiskLevel.MEDIUM:
-            return (f"REVIEW REQUIRED - Medium risk profile. {medium_count} case(s) need "
-                   f"manual review before making a decision.")
-        
-        elif overall_risk == RiskLevel.LOW:
-            return (f"CONDITIONAL APPROVAL - Low risk profile. {low_count} minor case(s) "
-                   f"identified but may be acceptable depending on role requirements.")
-        
-        elif overall_risk == RiskLevel.CLEAN:
-            if ignored_count > 0:
-                return (f"APPROVE - Clean background check. {ignored_count} case(s) were "
-                       f"outside assessment criteria.")
-            else:
-                return "APPROVE - Clean background check with no concerning records found."
-        
-        else:
-            return "MANUAL REVIEW - Unable to determine risk level automatically."
+        return _recommendation_text(
+            overall_risk,
+            len(processed_cases.get("High", [])),
+            len(processed_cases.get("Medium", [])),
+            len(processed_cases.get("Low", [])),
+            len(processed_cases.get("Ignored", []))
+        )
     
     def _format_person_info(self, **kwargs) -> Dict[str, str]:
         """Format person information for tracking."""
@@ -144,6 +155,55 @@ class CriminalBackgroundRuleEngine:
             "processed_at": datetime.now().isoformat()
         }
     
+    def _assess_response(self,
+                         checkr_response: Dict[str, Any],
+                         person_info: Dict[str, str],
+                         start_time: float) -> RuleEngineResult:
+        """
+        Run the risk assessment steps on a Checkr response.
+        
+        Args:
+            checkr_response: Instant criminal check response from Checkr
+            person_info: Formatted person information for tracking
+            start_time: time.time() when this person's check started
+            
+        Returns:
+            Complete RuleEngineResult for the response
+        """
+        checkr_check_id = checkr_response.get("id", "unknown")
+        
+        # Step 2: Process records through risk assessment engine
+        logger.info("\n[STEP 2] Processing records through risk assessment engine...")
+        processed_cases = self.risk_processor.process_criminal_check(checkr_response)
+        
+        # Count processed cases
+        total_processed = sum(len(cases) for cases in processed_cases.values())
+        logger.info("✓ Processed %d case(s) through risk engine", total_processed)
+        
+        # Step 3: Generate summary and recommendations
+        logger.info("\n[STEP 3] Generating risk assessment and recommendations...")
+        summary = self.risk_processor.get_summary(processed_cases)
+        overall_risk = self._calculate_overall_risk(processed_cases)
+        recommendation = self._generate_recommendation(overall_risk, processed_cases)
+        
+        execution_time = time.time() - start_time
+        
+        logger.info("✓ Risk assessment completed in %.2f seconds", execution_time)
+        logger.info("Overall Risk Level: %s", overall_risk.value)
+        logger.info("Recommendation: %s", recommendation)
+        
+        # Create complete result
+        return RuleEngineResult(
+            checkr_check_id=checkr_check_id,
+            checkr_response=checkr_response,
+            processed_cases=processed_cases,
+            summary=summary,
+            execution_time_seconds=execution_time,
+            person_info=person_info,
+            recommendation=recommendation,
+            overall_risk_level=overall_risk
+        )
+    
     def run_complete_background_check(self,
                                     first_name: str,
                                     last_name: str,
@@ -174,9 +234,9 @@ class CriminalBackgroundRuleEngine:
         
         self.start_time = time.time()
         
-        print("=" * 80)
-        print("CRIMINAL BACKGROUND CHECK RULE ENGINE")
-        print("=" * 80)
+        logger.info("=" * 80)
+        logger.info("CRIMINAL BACKGROUND CHECK RULE ENGINE")
+        logger.info("=" * 80)
         
         # Format person info for tracking
         person_info = self._format_person_info(
@@ -186,13 +246,13 @@ class CriminalBackgroundRuleEngine:
             reference_id=reference_id
         )
         
-        print(f"Processing: {first_name} {last_name}")
+        logger.info("Processing: %s %s", first_name, last_name)
         if reference_id:
-            print(f"Reference ID: {reference_id}")
+            logger.info("Reference ID: %s", reference_id)
         
         try:
             # Step 1: Get criminal records from Checkr API
-            print("\n[STEP 1] Retrieving criminal records from Checkr API...")
+            logger.info("\n[STEP 1] Retrieving criminal records from Checkr API...")
             checkr_response = self.api_client.run_instant_criminal_check(
                 first_name=first_name,
                 last_name=last_name,
@@ -205,48 +265,71 @@ class CriminalBackgroundRuleEngine:
                 reference_id=reference_id
             )
             
-            checkr_check_id = checkr_response.get("id", "unknown")
             records_count = checkr_response.get("results_info", {}).get("records_found", 0)
-            print(f"✓ Retrieved {records_count} criminal record(s) from Checkr")
+            logger.info("✓ Retrieved %s criminal record(s) from Checkr", records_count)
             
-            # Step 2: Process records through risk assessment engine
-            print("\n[STEP 2] Processing records through risk assessment engine...")
-            processed_cases = self.risk_processor.process_criminal_check(checkr_response)
+            # Steps 2 and 3: risk assessment and recommendations
+            return self._assess_response(checkr_response, person_info, self.start_time)
             
-            # Count processed cases
-            total_processed = sum(len(cases) for cases in processed_cases.values())
-            print(f"✓ Processed {total_processed} case(s) through risk engine")
-            
-            # Step 3: Generate summary and recommendations
-            print("\n[STEP 3] Generating risk assessment and recommendations...")
-            summary = self.risk_processor.get_summary(processed_cases)
-            overall_risk = self._calculate_overall_risk(processed_cases)
-            recommendation = self._generate_recommendation(overall_risk, processed_cases)
+        except Exception as e:
+            execution_time = time.time() - self.start_time if self.start_time else 0
+            error_msg = f"Rule engine execution failed after {execution_time:.2f} seconds: {e}"
+            logger.error("❌ %s", error_msg)
+            raise RuleEngineError(error_msg)
+    
+    async def run_background_checks_async(self,
+                                          people: List[Dict[str, Any]],
+                                          concurrency: int = 10) -> List[Union[RuleEngineResult, RuleEngineError]]:
+        """
+        Execute the complete workflow for many people, overlapping the API calls.
+        
+        All Checkr requests are issued concurrently (see
+        CheckrAPIClient.create_instant_criminal_checks_bulk); each response is
+        then assessed in the default thread pool so the event loop stays free.
+        A person whose request or assessment fails gets a RuleEngineError in
+        their slot instead of aborting the rest of the batch.
+        
+        Args:
+            people: Dicts with the same keys as run_complete_background_check's arguments
+            concurrency: Maximum number of Checkr requests in flight at once
             
-            execution_time = time.time() - self.start_time
+        Returns:
+            RuleEngineResult, or RuleEngineError for a failed person, in the same order as `people`
+        """
+        start_time = time.time()
+        logger.info("Processing batch of %d background check(s)", len(people))
+        
+        try:
+            responses = await self.api_client.create_instant_criminal_checks_bulk(
+                people, concurrency=concurrency
+            )
+            failed = sum(isinstance(response, Exception) for response in responses)
+            logger.info("✓ Retrieved %d Checkr response(s), %d failed", len(responses) - failed, failed)
             
-            print(f"✓ Risk assessment completed in {execution_time:.2f} seconds")
-            print(f"Overall Risk Level: {overall_risk.value}")
-            print(f"Recommendation: {recommendation}")
+            loop = asyncio.get_running_loop()
             
-            # Create complete result
-            result = RuleEngineResult(
-                checkr_check_id=checkr_check_id,
-                checkr_response=checkr_response,
-                processed_cases=processed_cases,
-                summary=summary,
-                execution_time_seconds=execution_time,
-                person_info=person_info,
-                recommendation=recommendation,
-                overall_risk_level=overall_risk
-            )
+            async def assess(person: Dict[str, Any], response) -> Union[RuleEngineResult, RuleEngineError]:
+                name = f"{person.get('first_name', '')} {person.get('last_name', '')}".strip()
+                if isinstance(response, Exception):
+                    error_msg = f"Checkr request failed for {name}: {response}"
+                else:
+                    try:
+                        return await loop.run_in_executor(
+                            None, self._assess_response, response, self._format_person_info(**person), start_time
+                        )
+                    except Exception as e:
+                        error_msg = f"Assessment failed for {name}: {e}"
+                logger.error("❌ %s", error_msg)
+                return RuleEngineError(error_msg)
             
-            return result
+            return list(await asyncio.gather(*(
+                assess(person, response) for person, response in zip(people, responses)
+            )))
             
         except Exception as e:
-            execution_time = time.time() - self.start_time if self.start_time else 0
-            error_msg = f"Rule engine execution failed after {execution_time:.2f} seconds: {e}"
-            print(f"❌ {error_msg}")
+            execution_time = time.time() - start_time
+            error_msg = f"Batch rule engine execution failed after {execution_time:.2f} seconds: {e}"
+            logger.error("❌ %s", error_msg)
             raise RuleEngineError(error_msg)
     
     def print_detailed_results(self, result: RuleEngineResult):
@@ -257,49 +340,54 @@ class CriminalBackgroundRuleEngine:
             result: RuleEngineResult to display
         """
         
-        print("\n" + "=" * 80)
-        print("DETAILED BACKGROUND CHECK RESULTS")
-        print("=" * 80)
-        
-        # Header information
-        print(f"Person: {result.person_info['first_name']} {result.person_info['last_name']}")
-        print(f"Check ID: {result.checkr_check_id}")
-        print(f"Processed At: {result.person_info['processed_at']}")
-        print(f"Execution Time: {result.execution_time_seconds:.2f} seconds")
-        print(f"Overall Risk: {result.overall_risk_level.value}")
-        print(f"Recommendation: {result.recommendation}")
-        
-        # Risk distribution
-        print(f"\nRisk Distribution:")
+        # Printed rather than logged so library callers who never configure
+        # logging still see the report; collected and written in one print call
+        lines = [
+            "\n" + "=" * 80,
+            "DETAILED BACKGROUND CHECK RESULTS",
+            "=" * 80,
+            
+            # Header information
+            f"Person: {result.person_info['first_name']} {result.person_info['last_name']}",
+            f"Check ID: {result.checkr_check_id}",
+            f"Processed At: {result.person_info['processed_at']}",
+            f"Execution Time: {result.execution_time_seconds:.2f} seconds",
+            f"Overall Risk: {result.overall_risk_level.value}",
+            f"Recommendation: {result.recommendation}",
+            
+            # Risk distribution
+            "\nRisk Distribution:"
+        ]
         for risk_level, cases in result.processed_cases.items():
-            print(f"  {risk_level}: {len(cases)} case(s)")
+            lines.append(f"  {risk_level}: {len(cases)} case(s)")
         
         # Detailed case breakdown
         for risk_level, cases in result.processed_cases.items():
             if cases:
-                print(f"\n{risk_level.upper()} RISK CASES ({len(cases)}):")
-                print("-" * 50)
+                lines.append(f"\n{risk_level.upper()} RISK CASES ({len(cases)}):")
+                lines.append("-" * 50)
                 
                 for i, case in enumerate(cases, 1):
-                    print(f"{i}. Case: {case.case_number}")
-                    print(f"   Description: {case.charge_description}")
-                    print(f"   Date: {case.offense_date}")
-                    print(f"   Type: {case.charge_type}")
-                    print(f"   Disposition: {case.disposition}")
-                    print(f"   Category: {case.category}")
+                    lines.append(f"{i}. Case: {case.case_number}")
+                    lines.append(f"   Description: {case.charge_description}")
+                    lines.append(f"   Date: {case.offense_date}")
+                    lines.append(f"   Type: {case.charge_type}")
+                    lines.append(f"   Disposition: {case.disposition}")
+                    lines.append(f"   Category: {case.category}")
                     if case.subcategory:
-                        print(f"   Subcategory: {case.subcategory}")
-                    print(f"   Risk Score: {case.risk_score}")
-                    print(f"   Reason: {case.reason}")
-                    print()
+                        lines.append(f"   Subcategory: {case.subcategory}")
+                    lines.append(f"   Risk Score: {case.risk_score}")
+                    lines.append(f"   Reason: {case.reason}")
+                    lines.append("")
         
         # Summary statistics
-        print("SUMMARY STATISTICS:")
-        print("-" * 50)
+        lines.append("SUMMARY STATISTICS:")
+        lines.append("-" * 50)
         for key, value in result.summary.items():
-            print(f"{key}: {value}")
+            lines.append(f"{key}: {value}")
         
-        print("\n" + "=" * 80)
+        lines.append("\n" + "=" * 80)
+        print("\n".join(lines))
     
     def export_results_json(self, result: RuleEngineResult, filename: Optional[str] = None) -> str:
         """
@@ -314,10 +402,27 @@ class CriminalBackgroundRuleEngine:
         """
         
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Stamp the file with the check's own processing time instead of
+            # reading the clock again
+            processed_at = result.person_info.get("processed_at")
+            stamp_time = datetime.fromisoformat(processed_at) if processed_at else datetime.now()
+            timestamp = stamp_time.strftime("%Y%m%d_%H%M%S")
             person_name = f"{result.person_info['first_name']}_{result.person_info['last_name']}"
             filename = f"background_check_{person_name}_{timestamp}.json"
         
+        # orjson serializes the ProcessedCase dataclasses and their RiskLevel
+        # natively; the stdlib encoder needs plain dicts
+        if orjson is not None:
+            processed_cases = result.processed_cases
+        else:
+            processed_cases = {
+                risk_level: [
+                    {**dict(zip(_CASE_FIELDS, _case_getter(case))), "risk_level": case.risk_level.value}
+                    for case in cases
+                ]
+                for risk_level, cases in result.processed_cases.items()
+            }
+        
         # Convert result to JSON-serializable format
         export_data = {
             "person_info": result.person_info,
@@ -326,37 +431,26 @@ class CriminalBackgroundRuleEngine:
             "recommendation": result.recommendation,
             "execution_time_seconds": result.execution_time_seconds,
             "summary": result.summary,
-            "processed_cases": {
-                risk_level: [
-                    {
-                        "case_number": case.case_number,
-                        "charge_description": case.charge_description,
-                        "offense_date": case.offense_date,
-                        "charge_type": case.charge_type,
-                        "disposition": case.disposition,
-                        "category": case.category,
-                        "subcategory": case.subcategory,
-                        "risk_level": case.risk_level.value,
-                        "risk_score": case.risk_score,
-                        "reason": case.reason
-                    }
-                    for case in cases
-                ]
-                for risk_level, cases in result.processed_cases.items()
-            },
+            "processed_cases": processed_cases,
             "checkr_response": result.checkr_response
         }
         
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(export_data, f, indent=2)
         
-        print(f"✓ Results exported to: {filename}")
+        logger.info("✓ Results exported to: %s", filename)
         return filename
 
 
 def main():
     """Example usage of the Criminal Background Check Rule Engine."""
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     try:
         # Initialize the rule engine
         engine = CriminalBackgroundRuleEngine(
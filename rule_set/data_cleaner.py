@@ -1,40 +1,48 @@
 import pandas as pd
 import numpy as np
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import xlsxwriter  # noqa: F401  (faster Excel writer, used when installed)
+    EXCEL_ENGINE = 'xlsxwriter'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+LINE_BREAK_RE = re.compile(r'[\r\n]')
+
 def clean_column_names(df):
     """
     Clean column names by removing line breaks, extra spaces, and empty names
     """
-    # Create a mapping for column renaming
-    column_mapping = {}
+    # Replace each line break with a space and strip whitespace, across all names at once
+    cleaned = df.columns.astype(str).str.replace(LINE_BREAK_RE, ' ', regex=True).str.strip()
     
-    for col in df.columns:
-        # Replace line breaks with spaces and strip whitespace
-        clean_name = str(col).replace('\n', ' ').replace('\r', ' ').strip()
-        
+    new_names = []
+    for position, clean_name in enumerate(cleaned):
         # Handle empty or generic column names
         if clean_name == '' or clean_name == 'nan' or clean_name.startswith('_'):
-            clean_name = f'empty_col_{df.columns.get_loc(col)}'
+            clean_name = f'empty_col_{position}'
         
         # Shorten very long column names
         if len(clean_name) > 50:
             clean_name = clean_name[:47] + '...'
             
-        column_mapping[col] = clean_name
+        new_names.append(clean_name)
     
-    return df.rename(columns=column_mapping)
+    return df.set_axis(new_names, axis=1)
 
 def remove_empty_columns(df):
     """
     Remove columns that are completely empty or contain only null/empty values
     """
-    # Identify columns that are completely empty
-    empty_cols = []
-    for col in df.columns:
-        if df[col].isna().all() or (df[col] == '').all():
-            empty_cols.append(col)
+    # Identify columns that are completely empty, reducing all columns at once
+    na_mask = df.isna().to_numpy().all(axis=0)
+    text_cols = df.select_dtypes(include=['object', 'string'])
+    empty_mask = text_cols.eq('').all(axis=0).reindex(df.columns, fill_value=False).to_numpy()
+    empty_cols = list(df.columns[na_mask | empty_mask])
     
     # Remove empty columns
     df_cleaned = df.drop(columns=empty_cols)
@@ -45,20 +53,24 @@ def remove_empty_columns(df):
 def clean_data_values(df):
     """
     Clean data values - handle missing values, trim whitespace, etc.
-    """
-    # Create a copy to avoid modifying original
-    df_cleaned = df.copy()
     
+    Only object columns are rewritten, in place on df; callers reassign the
+    result, so no full copy of the frame is made.
+    """
     # Clean string columns
-    for col in df_cleaned.columns:
-        if df_cleaned[col].dtype == 'object':
-            # Strip whitespace from string values
-            df_cleaned[col] = df_cleaned[col].astype(str).str.strip()
-            
-            # Replace empty strings with NaN
-            df_cleaned[col] = df_cleaned[col].replace(['', 'nan', 'None'], np.nan)
-    
-    return df_cleaned
+    obj_cols = df.select_dtypes(include=['object', 'string']).columns
+    if len(obj_cols):
+        # Strip whitespace element-wise from the str values only; bools, numbers
+        # and NaN in mixed object columns are kept as they are (the .str
+        # accessor would NaN them, or raise on a column with no strings at all).
+        # Then replace empty strings with NaN
+        df[obj_cols] = (
+            df[obj_cols]
+            .apply(lambda s: s.map(lambda v: v.strip() if isinstance(v, str) else v))
+            .replace(['', 'nan', 'None'], np.nan)
+        )
+    
+    return df
 
 def remove_empty_rows(df):
     """
@@ -67,8 +79,9 @@ def remove_empty_rows(df):
     # Count rows before
     initial_rows = len(df)
     
-    # Remove rows where all values are NaN
-    df_cleaned = df.dropna(how='all')
+    # Remove rows where all values are NaN, reducing the null mask as a plain array
+    keep_rows = ~df.isna().to_numpy().all(axis=1)
+    df_cleaned = df[keep_rows]
     
     # Count rows after
     final_rows = len(df_cleaned)
@@ -129,53 +142,51 @@ def main():
     output_dir = Path('cleaned_data')
     output_dir.mkdir(exist_ok=True)
     
-    # Dictionary to store cleaned dataframes
-    cleaned_data = {}
-    
-    # Process each file
+    # Process each file; files are independent, so clean them in parallel
+    existing_files = []
     for file_path in input_files:
         if os.path.exists(file_path):
-            df_cleaned = clean_csv_file(file_path)
-            if df_cleaned is not None:
-                cleaned_data[file_path] = df_cleaned
+            existing_files.append(file_path)
         else:
             print(f"File not found: {file_path}")
     
-    # Save cleaned files
-    print(f"\n{'='*50}")
-    print("Saving cleaned files...")
-    print(f"{'='*50}")
-    
-    for file_name, df in cleaned_data.items():
-        # Create output filename
-        base_name = Path(file_name).stem
-        output_file = output_dir / f"{base_name}_cleaned.csv"
-        
-        # Save cleaned CSV
-        df.to_csv(output_file, index=False, encoding='utf-8')
-        print(f"Saved: {output_file}")
-    
-    # Create a summary file
     summary_file = output_dir / "cleaning_summary.txt"
-    with open(summary_file, 'w') as f:
-        f.write("CSV Data Cleaning Summary\n")
-        f.write("=" * 30 + "\n\n")
-        
-        for file_name, df in cleaned_data.items():
-            f.write(f"File: {file_name}\n")
-            f.write(f"  Final shape: {df.shape}\n")
-            f.write(f"  Columns: {list(df.columns)}\n")
-            f.write(f"  Data types: {dict(df.dtypes)}\n\n")
-    
-    print(f"Summary saved: {summary_file}")
-    
-    # Create a combined Excel file with all cleaned data
     excel_file = output_dir / "all_cleaned_data.xlsx"
-    with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-        for file_name, df in cleaned_data.items():
-            sheet_name = Path(file_name).stem[:31]  # Excel sheet name limit
+    max_workers = max(1, min(len(existing_files), os.cpu_count() or 1))
+    
+    # Save each cleaned file, its summary entry and its Excel sheet as soon as it
+    # is collected, so only one cleaned dataframe is held here at a time
+    with ProcessPoolExecutor(max_workers=max_workers) as executor, \
+            open(summary_file, 'w') as summary, \
+            pd.ExcelWriter(excel_file, engine=EXCEL_ENGINE) as writer:
+        futures = {file_path: executor.submit(clean_csv_file, file_path)
+                   for file_path in existing_files}
+        
+        summary.write("CSV Data Cleaning Summary\n")
+        summary.write("=" * 30 + "\n\n")
+        
+        # Collect in input order so the outputs keep a stable sheet order
+        for file_path in existing_files:
+            df = futures.pop(file_path).result()
+            if df is None:
+                continue
+            
+            # Save cleaned CSV
+            base_name = Path(file_path).stem
+            output_file = output_dir / f"{base_name}_cleaned.csv"
+            df.to_csv(output_file, index=False, encoding='utf-8')
+            print(f"Saved: {output_file}")
+            
+            summary.write(f"File: {file_path}\n")
+            summary.write(f"  Final shape: {df.shape}\n")
+            summary.write(f"  Columns: {list(df.columns)}\n")
+            summary.write(f"  Data types: {dict(df.dtypes)}\n\n")
+            
+            sheet_name = base_name[:31]  # Excel sheet name limit
             df.to_excel(writer, sheet_name=sheet_name, index=False)
+            del df
     
+    print(f"Summary saved: {summary_file}")
     print(f"Combined Excel file saved: {excel_file}")
     
     print(f"\nCleaning complete! All files saved to: {output_dir}")
@@ -1,9 +1,13 @@
+import asyncio
+import hashlib
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
 import json
 import os
 import sys
 import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional
 
@@ -16,9 +20,48 @@ except ImportError as e:
     print(f"Error importing RuleCore: {e}")
     print("Make sure RuleCore.py, CheckrAPI.py, and CriminalCheck.py are in the engine_core directory")
 
+# Slice size for large inserts into the result text widgets
+INSERT_CHUNK_SIZE = 64 * 1024
+
+
+def _insert_chunked(widget, text, chunk_size=INSERT_CHUNK_SIZE):
+    """Append text to a Text widget in slices, letting Tk redraw between them."""
+    for start in range(0, len(text), chunk_size):
+        widget.insert(tk.END, text[start:start + chunk_size])
+        widget.update_idletasks()
+
+
+class _TextWidgetWriter:
+    """File-like sink that appends written text to a Tk Text widget in chunks."""
+    
+    def __init__(self, widget, chunk_size=INSERT_CHUNK_SIZE):
+        self.widget = widget
+        self.chunk_size = chunk_size
+        self._parts = []
+        self._size = 0
+    
+    def write(self, text):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.chunk_size:
+            self.flush()
+    
+    def flush(self):
+        if self._parts:
+            self.widget.insert(tk.END, "".join(self._parts))
+            self.widget.update_idletasks()
+            self._parts.clear()
+            self._size = 0
+
+
 class BackgroundCheckUI:
     """Tkinter GUI for the Criminal Background Check Rule Engine."""
     
+    # Most recent results kept for repeat runs with unchanged form values
+    RESULT_CACHE_SIZE = 64
+    # Seconds a cached result is reused; check statuses change over time
+    RESULT_CACHE_TTL = 300
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Criminal Background Check System")
@@ -28,6 +71,12 @@ class BackgroundCheckUI:
         # Initialize rule engine (will be done when first needed)
         self.rule_engine = None
         self.current_result = None
+        self._result_cache = OrderedDict()
+        self._pending_raw = None
+        
+        # Single event loop for the app's lifetime; checks are submitted to it as coroutines
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
         
         self.setup_ui()
         self.update_status("Ready")
@@ -71,14 +120,10 @@ class BackgroundCheckUI:
         # Create input fields
         self.fields = {}
         
-        # Required fields
-        required_fields = [
-            ("First Name*", "first_name"),
-            ("Last Name*", "last_name")
-        ]
-        
-        # Optional fields
-        optional_fields = [
+        # Fields in display order; required ones are validated and marked with "*"
+        field_specs = [
+            ("First Name", "first_name"),
+            ("Last Name", "last_name"),
             ("Date of Birth (YYYY-MM-DD)", "dob"),
             ("Middle Name", "middle_name"),
             ("SSN (XXX-XX-XXXX)", "ssn"),
@@ -86,30 +131,20 @@ class BackgroundCheckUI:
             ("Phone (+1XXXXXXXXXX)", "phone"),
             ("Reference ID", "reference_id")
         ]
+        required_fields = {"first_name", "last_name"}
         
-        row = start_row + 1
-        
-        # Add required fields
-        for label_text, field_name in required_fields:
-            label = ttk.Label(parent, text=label_text)
-            label.grid(row=row, column=0, sticky=tk.W, padx=(0, 10), pady=2)
+        # Add all fields in one pass
+        for row, (label_text, field_name) in enumerate(field_specs, start=start_row + 1):
+            if field_name in required_fields:
+                label_text += "*"
+            ttk.Label(parent, text=label_text).grid(row=row, column=0, sticky=tk.W, padx=(0, 10), pady=2)
             
             entry = ttk.Entry(parent, width=30)
             entry.grid(row=row, column=1, sticky=(tk.W, tk.E), pady=2)
             
             self.fields[field_name] = entry
-            row += 1
         
-        # Add optional fields
-        for label_text, field_name in optional_fields:
-            label = ttk.Label(parent, text=label_text)
-            label.grid(row=row, column=0, sticky=tk.W, padx=(0, 10), pady=2)
-            
-            entry = ttk.Entry(parent, width=30)
-            entry.grid(row=row, column=1, sticky=(tk.W, tk.E), pady=2)
-            
-            self.fields[field_name] = entry
-            row += 1
+        row = start_row + 1 + len(field_specs)
         
         # Address section (simplified)
         address_label = ttk.Label(parent, text="Address (Optional)")
@@ -179,22 +214,28 @@ class BackgroundCheckUI:
         self.summary_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.summary_frame, text="Summary")
         
-        self.summary_text = scrolledtext.ScrolledText(self.summary_frame, height=15, wrap=tk.WORD)
+        self.summary_text = scrolledtext.ScrolledText(self.summary_frame, height=15, wrap=tk.WORD,
+                                                      undo=False, autoseparators=False, maxundo=0)
         self.summary_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Detailed Results Tab
         self.details_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.details_frame, text="Detailed Results")
         
-        self.details_text = scrolledtext.ScrolledText(self.details_frame, height=15, wrap=tk.WORD)
+        self.details_text = scrolledtext.ScrolledText(self.details_frame, height=15, wrap=tk.WORD,
+                                                      undo=False, autoseparators=False, maxundo=0)
         self.details_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Raw Data Tab
         self.raw_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.raw_frame, text="Raw API Data")
         
-        self.raw_text = scrolledtext.ScrolledText(self.raw_frame, height=15, wrap=tk.WORD)
+        self.raw_text = scrolledtext.ScrolledText(self.raw_frame, height=15, wrap=tk.WORD,
+                                                  undo=False, autoseparators=False, maxundo=0)
         self.raw_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # The raw JSON is only rendered once its tab is opened
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
     
     def setup_status_bar(self, parent, start_row):
         """Setup status bar."""
@@ -203,17 +244,23 @@ class BackgroundCheckUI:
         self.status_bar = ttk.Label(parent, textvariable=self.status_var, relief=tk.SUNKEN)
         self.status_bar.grid(row=start_row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0))
     
-    def update_status(self, message):
-        """Update status bar message."""
+    def update_status(self, message, force=False):
+        """
+        Update status bar message.
+        
+        The label redraws on Tk's next idle pass; pass force=True only when the
+        main thread is about to block and the message must be visible first.
+        """
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.status_var.set(f"[{timestamp}] {message}")
-        self.root.update_idletasks()
+        if force:
+            self.root.update_idletasks()
     
     def initialize_rule_engine(self):
         """Initialize the rule engine if not already done."""
         if self.rule_engine is None:
             try:
-                self.update_status("Initializing rule engine...")
+                self.update_status("Initializing rule engine...", force=True)
                 
                 # Look for config files in engine_core directory
                 engine_core_dir = os.path.join(os.path.dirname(__file__), '..', 'engine_core')
@@ -262,12 +309,25 @@ class BackgroundCheckUI:
         return data
     
     def run_background_check(self):
-        """Run the background check in a separate thread."""
+        """Run the background check on the background event loop."""
         
         try:
             # Validate form data
             form_data = self.get_form_data()
             
+            # Identical form values within RESULT_CACHE_TTL: show the earlier
+            # result without calling the API again
+            key = self._form_key(form_data)
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                cached_at, result = cached
+                if time.monotonic() - cached_at < self.RESULT_CACHE_TTL:
+                    self._result_cache.move_to_end(key)
+                    self.clear_results()
+                    self.display_results(result)
+                    return
+                del self._result_cache[key]
+            
             # Initialize rule engine if needed
             if not self.initialize_rule_engine():
                 return
@@ -279,27 +339,50 @@ class BackgroundCheckUI:
             # Clear previous results
             self.clear_results()
             
-            # Run in separate thread to prevent UI freezing
-            def run_check():
-                try:
-                    result = self.rule_engine.run_complete_background_check(**form_data)
-                    
-                    # Update UI in main thread
-                    self.root.after(0, lambda: self.display_results(result))
-                    
-                except Exception as e:
-                    error_msg = f"Background check failed: {str(e)}"
-                    self.root.after(0, lambda: self.handle_error(error_msg))
-            
-            # Start background thread
-            thread = threading.Thread(target=run_check, daemon=True)
-            thread.start()
+            # Run on the background event loop to prevent UI freezing
+            future = asyncio.run_coroutine_threadsafe(self._run_check(form_data), self.loop)
+            future.add_done_callback(lambda f: self._on_check_done(key, f))
             
         except ValueError as e:
             messagebox.showerror("Validation Error", str(e))
         except Exception as e:
             self.handle_error(f"Error starting background check: {str(e)}")
     
+    async def _run_check(self, form_data):
+        """Coroutine running one background check in the loop's default thread pool."""
+        # The synchronous workflow keeps the pooled requests session with its
+        # retry policy and token refresh; the executor keeps it off the Tk thread
+        return await self.loop.run_in_executor(
+            None, lambda: self.rule_engine.run_complete_background_check(**form_data))
+    
+    @staticmethod
+    def _form_key(form_data):
+        """Stable digest of the submitted form values, used as the result cache key."""
+        payload = json.dumps(form_data, sort_keys=True).encode()
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
+    def _cache_result(self, key, result):
+        """Remember a result, evicting the least recently used beyond RESULT_CACHE_SIZE."""
+        self._result_cache[key] = (time.monotonic(), result)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+    
+    def _on_check_done(self, key, future):
+        """Hand a finished check back to the Tk main loop."""
+        try:
+            result = future.result()
+        except Exception as e:
+            error_msg = f"Background check failed: {str(e)}"
+            self.root.after(0, lambda: self.handle_error(error_msg))
+            return
+        
+        def finish():
+            self._cache_result(key, result)
+            self.display_results(result)
+        
+        self.root.after(0, finish)
+    
     def display_results(self, result: RuleEngineResult):
         """Display the background check results."""
         
@@ -317,8 +400,9 @@ class BackgroundCheckUI:
         # Display detailed results
         self.display_detailed_results(result)
         
-        # Display raw API data
-        self.display_raw_data(result)
+        # Raw API data is rendered lazily, when its tab is shown
+        self._pending_raw = result
+        self._on_tab_changed()
         
         # Update status with recommendation
         risk_color = {
@@ -337,7 +421,7 @@ class BackgroundCheckUI:
     def display_summary(self, result: RuleEngineResult):
         """Display summary results."""
         
-        summary = f"""BACKGROUND CHECK SUMMARY
+        parts = [f"""BACKGROUND CHECK SUMMARY
 {'='*50}
 
 Person: {result.person_info['first_name']} {result.person_info['last_name']}
@@ -350,64 +434,76 @@ Risk Level: {result.overall_risk_level.value}
 Recommendation: {result.recommendation}
 
 CASE DISTRIBUTION:
-"""
+"""]
+        append = parts.append
         
         for risk_level, cases in result.processed_cases.items():
-            summary += f"  {risk_level}: {len(cases)} case(s)\n"
+            append(f"  {risk_level}: {len(cases)} case(s)\n")
         
-        summary += f"\nTOTAL CASES PROCESSED: {result.summary['total_cases']}\n"
-        summary += f"HIGHEST RISK SCORE: {result.summary['highest_risk_score']}\n"
+        append(f"\nTOTAL CASES PROCESSED: {result.summary['total_cases']}\n")
+        append(f"HIGHEST RISK SCORE: {result.summary['highest_risk_score']}\n")
         
         if result.summary.get('recommendations'):
-            summary += f"\nADDITIONAL NOTES:\n"
+            append("\nADDITIONAL NOTES:\n")
             for rec in result.summary['recommendations']:
-                summary += f"  - {rec}\n"
+                append(f"  - {rec}\n")
         
         self.summary_text.delete(1.0, tk.END)
-        self.summary_text.insert(1.0, summary)
+        self.summary_text.insert(1.0, "".join(parts))
     
     def display_detailed_results(self, result: RuleEngineResult):
         """Display detailed case-by-case results."""
         
-        details = f"""DETAILED CASE ANALYSIS
+        parts = [f"""DETAILED CASE ANALYSIS
 {'='*50}
 
-"""
+"""]
+        append = parts.append
         
         for risk_level, cases in result.processed_cases.items():
             if cases:
-                details += f"{risk_level.upper()} RISK CASES ({len(cases)}):\n"
-                details += f"{'-'*40}\n"
+                append(f"{risk_level.upper()} RISK CASES ({len(cases)}):\n")
+                append(f"{'-'*40}\n")
                 
                 for i, case in enumerate(cases, 1):
-                    details += f"{i}. Case: {case.case_number}\n"
-                    details += f"   Description: {case.charge_description}\n"
-                    details += f"   Date: {case.offense_date}\n"
-                    details += f"   Type: {case.charge_type}\n"
-                    details += f"   Disposition: {case.disposition}\n"
-                    details += f"   Category: {case.category}\n"
+                    append(f"{i}. Case: {case.case_number}\n"
+                           f"   Description: {case.charge_description}\n"
+                           f"   Date: {case.offense_date}\n"
+                           f"   Type: {case.charge_type}\n"
+                           f"   Disposition: {case.disposition}\n"
+                           f"   Category: {case.category}\n")
                     if case.subcategory:
-                        details += f"   Subcategory: {case.subcategory}\n"
-                    details += f"   Risk Score: {case.risk_score}\n"
-                    details += f"   Reason: {case.reason}\n\n"
+                        append(f"   Subcategory: {case.subcategory}\n")
+                    append(f"   Risk Score: {case.risk_score}\n"
+                           f"   Reason: {case.reason}\n\n")
                 
-                details += "\n"
+                append("\n")
         
         self.details_text.delete(1.0, tk.END)
-        self.details_text.insert(1.0, details)
+        _insert_chunked(self.details_text, "".join(parts))
+    
+    def _on_tab_changed(self, event=None):
+        """Render pending raw API data if the Raw API Data tab is showing."""
+        if self._pending_raw is not None and self.notebook.select() == str(self.raw_frame):
+            result, self._pending_raw = self._pending_raw, None
+            self.display_raw_data(result)
     
     def display_raw_data(self, result: RuleEngineResult):
         """Display raw API response data."""
         
-        raw_data = json.dumps(result.checkr_response, indent=2)
         self.raw_text.delete(1.0, tk.END)
-        self.raw_text.insert(1.0, raw_data)
+        
+        # Stream the dump into the widget rather than building one large string
+        writer = _TextWidgetWriter(self.raw_text)
+        json.dump(result.checkr_response, writer, indent=2)
+        writer.flush()
     
     def clear_results(self):
         """Clear all result displays."""
         self.summary_text.delete(1.0, tk.END)
         self.details_text.delete(1.0, tk.END)
         self.raw_text.delete(1.0, tk.END)
+        self._pending_raw = None
         self.current_result = None
         self.export_button.config(state="disabled")
     
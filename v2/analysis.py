@@ -4,9 +4,10 @@ import os
 import sys
 
 def main():
-    df1 = pd.read_csv('./auto_bi.csv')
-    df2 = pd.read_csv('./auto_collision.csv')
-    df3 = pd.read_csv('./datacar.csv')
+    # Only the column names are printed, so parse just the header row
+    df1 = pd.read_csv('./auto_bi.csv', nrows=0)
+    df2 = pd.read_csv('./auto_collision.csv', nrows=0)
+    df3 = pd.read_csv('./datacar.csv', nrows=0)
 
     print(df1.columns)
     print(df2.columns)
@@ -7,8 +7,10 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import pickle
+import threading
+from bisect import bisect_right
+from types import MappingProxyType
 import plotly.graph_objects as go
-import plotly.express as px
 
 # ============================================
 # PAGE CONFIG
@@ -122,60 +124,224 @@ le_gender = models['label_encoders']['gender']
 le_area = models['label_encoders']['area']
 weights = models['weights']
 
+# Weights as a contiguous float64 vector for the per-applicant dot product.
+# float64 rather than float32 so truncating the dot to int gives the same
+# scores at tier boundaries as before.
+WEIGHT_VECTOR = np.ascontiguousarray(weights, dtype=np.float64)
+
+# Reusable component buffer, one per thread (Streamlit serves sessions from
+# several threads, so a single module-level buffer would be shared)
+_buffers = threading.local()
+
+# Label encoders as plain dicts: encoding becomes one hash lookup instead of
+# a LabelEncoder.transform call with its validation and array conversions
+BODY_IDX = {c: i for i, c in enumerate(le_body.classes_)}
+AREA_IDX = {c: i for i, c in enumerate(le_area.classes_)}
+GENDER_IDX = {c: i for i, c in enumerate(le_gender.classes_)}
+
+# Keys of a scores dict, in display order
+SCORE_KEYS = ('age', 'vehicle', 'location', 'gender', 'final_weighted')
+
+# Whole-number input grids the sidebar can produce, each starting at 1
+AGE_CATEGORY_COUNT = 6
+VEHICLE_VALUE_COUNT = 10
+VEHICLE_AGE_COUNT = 4
+
+@st.cache_resource
+def build_score_tables(_models):
+    """Precompute component scores (1-100) for every input on the grids (cached)"""
+    # Model files written by model.py ship the tables; older ones are scored here
+    if 'score_tables' in _models:
+        return _models['score_tables']
+    
+    def table(model, rows):
+        # Truncate like the per-row int(prob * 100), then store as uint8: every
+        # score fits in 0-100 and all tables together stay a few KB
+        return (model.predict_proba(np.asarray(rows))[:, 1] * 100).astype(np.uint8)
+    
+    n_body = len(_models['label_encoders']['veh_body'].classes_)
+    vehicle_rows = [[value, age, body]
+                    for value in range(1, VEHICLE_VALUE_COUNT + 1)
+                    for age in range(1, VEHICLE_AGE_COUNT + 1)
+                    for body in range(n_body)]
+    
+    return {
+        'age': table(_models['age_model'], [[c] for c in range(1, AGE_CATEGORY_COUNT + 1)]),
+        'vehicle': table(_models['vehicle_model'], vehicle_rows).reshape(
+            VEHICLE_VALUE_COUNT, VEHICLE_AGE_COUNT, n_body),
+        'location': table(_models['location_model'],
+                          [[i] for i in range(len(_models['label_encoders']['area'].classes_))]),
+        'gender': table(_models['gender_model'],
+                        [[i] for i in range(len(_models['label_encoders']['gender'].classes_))])
+    }
+
+score_tables = build_score_tables(models)
+AGE_SCORES = score_tables['age']
+VEHICLE_SCORES = score_tables['vehicle']
+LOCATION_SCORES = score_tables['location']
+GENDER_SCORES = score_tables['gender']
+
 # ============================================
 # SCORING FUNCTIONS
 # ============================================
 
+def _grid_index(value, count):
+    """Zero-based table index for a whole number in 1..count, or None if off the grid"""
+    try:
+        index = int(value)
+    except (TypeError, ValueError):
+        return None
+    if index == value and 1 <= index <= count:
+        return index - 1
+    return None
+
+def _age_score(age_category):
+    """Age component score; categories off the grid fall back to the model"""
+    index = _grid_index(age_category, AGE_CATEGORY_COUNT)
+    if index is not None:
+        return int(AGE_SCORES[index])
+    return int(age_model.predict_proba([[age_category]])[0, 1] * 100)
+
+def _vehicle_score(vehicle_value, vehicle_age, body_encoded):
+    """Vehicle component score; values or ages off the grid fall back to the model"""
+    value_index = _grid_index(vehicle_value, VEHICLE_VALUE_COUNT)
+    age_index = _grid_index(vehicle_age, VEHICLE_AGE_COUNT)
+    if value_index is not None and age_index is not None:
+        return int(VEHICLE_SCORES[value_index, age_index, body_encoded])
+    return int(vehicle_model.predict_proba([[vehicle_value, vehicle_age, body_encoded]])[0, 1] * 100)
+
+def _encode(index, value):
+    """Encoded class for a categorical input, or None if it is unknown or not a string"""
+    return index.get(value.upper()) if isinstance(value, str) else None
+
+def _component_buffer():
+    """This thread's float64 buffer for the four component scores"""
+    buffer = getattr(_buffers, 'components', None)
+    if buffer is None:
+        buffer = _buffers.components = np.empty(len(WEIGHT_VECTOR))
+    return buffer
+
 def get_age_risk_score(age_category):
     """Get risk score for driver age category (1-100)"""
-    prob = age_model.predict_proba([[age_category]])[0, 1]
-    return int(prob * 100)
+    return _age_score(age_category)
 
 def get_vehicle_risk_score(vehicle_value, vehicle_age, vehicle_body):
     """Get risk score for vehicle characteristics (1-100)"""
-    try:
-        body_encoded = le_body.transform([vehicle_body.upper()])[0]
-        prob = vehicle_model.predict_proba([[vehicle_value, vehicle_age, body_encoded]])[0, 1]
-        return int(prob * 100)
-    except:
+    body_encoded = _encode(BODY_IDX, vehicle_body)
+    if body_encoded is None:
         return None
+    return _vehicle_score(vehicle_value, vehicle_age, body_encoded)
 
 def get_location_risk_score(area):
     """Get risk score for geographic area (1-100)"""
-    try:
-        area_encoded = le_area.transform([area.upper()])[0]
-        prob = location_model.predict_proba([[area_encoded]])[0, 1]
-        return int(prob * 100)
-    except:
+    area_encoded = _encode(AREA_IDX, area)
+    if area_encoded is None:
         return None
+    return int(LOCATION_SCORES[area_encoded])
 
 def get_gender_risk_score(gender):
     """Get risk score for driver gender (1-100)"""
-    try:
-        gender_encoded = le_gender.transform([gender.upper()])[0]
-        prob = gender_model.predict_proba([[gender_encoded]])[0, 1]
-        return int(prob * 100)
-    except:
+    gender_encoded = _encode(GENDER_IDX, gender)
+    if gender_encoded is None:
         return None
+    return int(GENDER_SCORES[gender_encoded])
 
 def get_all_risk_scores(age_category, vehicle_value, vehicle_age, vehicle_body, area, gender):
     """Get all risk scores and weighted final score"""
-    scores = {}
-    scores['age'] = get_age_risk_score(age_category)
-    scores['vehicle'] = get_vehicle_risk_score(vehicle_value, vehicle_age, vehicle_body)
-    scores['location'] = get_location_risk_score(area)
-    scores['gender'] = get_gender_risk_score(gender)
+    age_score = _age_score(age_category)
     
-    if None in scores.values():
+    # Encode the categorical inputs once; any unknown category fails the submission
+    body_encoded = _encode(BODY_IDX, vehicle_body)
+    area_encoded = _encode(AREA_IDX, area)
+    gender_encoded = _encode(GENDER_IDX, gender)
+    if body_encoded is None or area_encoded is None or gender_encoded is None:
         return None
     
-    component_array = np.array([scores['age'], scores['vehicle'], 
-                                scores['location'], scores['gender']])
-    final_score = int(np.dot(component_array, weights))
-    scores['final_weighted'] = final_score
+    try:
+        vehicle_score = _vehicle_score(vehicle_value, vehicle_age, body_encoded)
+    except ValueError:
+        # Off-grid values the model rejects (e.g. NaN from an uploaded file)
+        return None
+    
+    components = (age_score, vehicle_score,
+                  int(LOCATION_SCORES[area_encoded]), int(GENDER_SCORES[gender_encoded]))
+    
+    # Fill the preallocated buffer instead of building a new array per applicant
+    buffer = _component_buffer()
+    buffer[:] = components
+    
+    scores = dict(zip(SCORE_KEYS, components))
+    scores['final_weighted'] = int(np.dot(buffer, WEIGHT_VECTOR))
     
     return scores
 
+def _on_grid(values, count):
+    """Mask of whole numbers in 1..count (vectorized counterpart of _grid_index)"""
+    return (values == np.floor(values)) & (values >= 1) & (values <= count)
+
+# Categorical upload columns are parsed straight into category dtype, so each
+# distinct label is upper-cased and looked up once rather than once per row
+BATCH_CSV_DTYPES = {'vehicle_body': 'category', 'area': 'category', 'gender': 'category'}
+
+def _encode_column(column, index):
+    """Encoded classes for a column of labels as floats, NaN where unknown"""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        categories = column.cat.categories.astype(str).str.upper().map(index).to_numpy(dtype=float)
+        # Code -1 (missing) picks up the trailing NaN
+        return np.append(categories, np.nan)[column.cat.codes.to_numpy()]
+    return column.astype(str).str.upper().map(index).to_numpy(dtype=float)
+
+def get_batch_risk_scores(df):
+    """
+    Score every applicant in a DataFrame at once.
+    
+    Mirrors get_all_risk_scores row by row, but encodes, looks up and weights
+    whole columns with NumPy; off-grid inputs go to each model in one batched
+    predict_proba call. Rows with an unknown category or a missing/non-numeric
+    value are skipped, as get_all_risk_scores returns None for them.
+    """
+    numeric = [pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=float)
+               for col in ('age_category', 'vehicle_value', 'vehicle_age')]
+    encoded = [_encode_column(df[col], index)
+               for col, index in (('vehicle_body', BODY_IDX), ('area', AREA_IDX), ('gender', GENDER_IDX))]
+    
+    valid = ~np.isnan(np.column_stack(numeric + encoded)).any(axis=1)
+    age_category, vehicle_value, vehicle_age = (column[valid] for column in numeric)
+    body_encoded, area_encoded, gender_encoded = (column[valid].astype(np.intp) for column in encoded)
+    
+    # Age: table lookup on the grid, one batched model call for the rest
+    age_scores = np.empty(len(age_category), dtype=np.uint8)
+    on_grid = _on_grid(age_category, AGE_CATEGORY_COUNT)
+    age_scores[on_grid] = AGE_SCORES[age_category[on_grid].astype(np.intp) - 1]
+    if not on_grid.all():
+        off_grid = ~on_grid
+        age_scores[off_grid] = (age_model.predict_proba(age_category[off_grid, None])[:, 1] * 100).astype(np.uint8)
+    
+    # Vehicle: same split over the value x age grid
+    vehicle_scores = np.empty(len(vehicle_value), dtype=np.uint8)
+    on_grid = _on_grid(vehicle_value, VEHICLE_VALUE_COUNT) & _on_grid(vehicle_age, VEHICLE_AGE_COUNT)
+    vehicle_scores[on_grid] = VEHICLE_SCORES[vehicle_value[on_grid].astype(np.intp) - 1,
+                                             vehicle_age[on_grid].astype(np.intp) - 1,
+                                             body_encoded[on_grid]]
+    if not on_grid.all():
+        off_grid = ~on_grid
+        X_vehicle = np.column_stack([vehicle_value[off_grid], vehicle_age[off_grid], body_encoded[off_grid]])
+        vehicle_scores[off_grid] = (vehicle_model.predict_proba(X_vehicle)[:, 1] * 100).astype(np.uint8)
+    
+    # Scores are 0-100, so the component matrix stays uint8; only the weighted
+    # sum is widened to float64, matching get_all_risk_scores' truncation
+    components = np.column_stack([age_scores, vehicle_scores,
+                                  LOCATION_SCORES[area_encoded], GENDER_SCORES[gender_encoded]])
+    
+    return pd.DataFrame({
+        'applicant_id': df.index.to_numpy()[valid] + 1,
+        'age_risk': components[:, 0],
+        'vehicle_risk': components[:, 1],
+        'location_risk': components[:, 2],
+        'gender_risk': components[:, 3],
+        'final_risk': (components @ WEIGHT_VECTOR).astype(np.int64)
+    })
+
 def age_to_category(actual_age):
     """Convert actual age to category (1-6)"""
     if actual_age < 26:
@@ -191,43 +357,57 @@ def age_to_category(actual_age):
     else:
         return 6
 
+# Upper bounds (exclusive) of the LOW, MODERATE and HIGH tiers
+RISK_THRESHOLDS = (30, 50, 70)
+
+# One read-only info dict per tier, built once and shared by every caller
+RISK_TIERS = tuple(MappingProxyType(tier) for tier in (
+    {
+        'level': '🟢 LOW RISK',
+        'color': '#10b981',
+        'premium': '$800 - $1,200/year',
+        'css_class': 'risk-low'
+    },
+    {
+        'level': '🟡 MODERATE RISK',
+        'color': '#f59e0b',
+        'premium': '$1,200 - $1,800/year',
+        'css_class': 'risk-moderate'
+    },
+    {
+        'level': '🟠 HIGH RISK',
+        'color': '#ef4444',
+        'premium': '$1,800 - $2,500/year',
+        'css_class': 'risk-high'
+    },
+    {
+        'level': '🔴 VERY HIGH RISK',
+        'color': '#dc2626',
+        'premium': '$2,500+/year',
+        'css_class': 'risk-very-high'
+    }
+))
+
 def get_risk_level_info(score):
     """Get risk level, color, and premium tier"""
-    if score < 30:
-        return {
-            'level': '🟢 LOW RISK',
-            'color': '#10b981',
-            'premium': '$800 - $1,200/year',
-            'css_class': 'risk-low'
-        }
-    elif score < 50:
-        return {
-            'level': '🟡 MODERATE RISK',
-            'color': '#f59e0b',
-            'premium': '$1,200 - $1,800/year',
-            'css_class': 'risk-moderate'
-        }
-    elif score < 70:
-        return {
-            'level': '🟠 HIGH RISK',
-            'color': '#ef4444',
-            'premium': '$1,800 - $2,500/year',
-            'css_class': 'risk-high'
-        }
-    else:
-        return {
-            'level': '🔴 VERY HIGH RISK',
-            'color': '#dc2626',
-            'premium': '$2,500+/year',
-            'css_class': 'risk-very-high'
-        }
+    return RISK_TIERS[bisect_right(RISK_THRESHOLDS, score)]
+
+# Tier color for every possible integer score 0-100, indexed directly by score
+RISK_COLORS = tuple(get_risk_level_info(score)['color'] for score in range(101))
 
 # ============================================
 # VISUALIZATION FUNCTIONS
 # ============================================
 
+# Plotly.js config for decorative charts: render a static image with no
+# hover, zoom or mode bar wiring
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+# Figures are cached as shared objects: the score space is small (ints 0-100),
+# so the same charts recur and Plotly's figure construction/validation is skipped
+@st.cache_resource(max_entries=512, show_spinner=False)
 def create_gauge_chart(score, title):
-    """Create a gauge chart for risk score"""
+    """Create a gauge chart for risk score (cached)"""
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
         value=score,
@@ -236,7 +416,7 @@ def create_gauge_chart(score, title):
         number={'font': {'size': 40, 'color': '#1f2937'}},
         gauge={
             'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "#6b7280"},
-            'bar': {'color': get_risk_level_info(score)['color']},
+            'bar': {'color': RISK_COLORS[score]},
             'bgcolor': "white",
             'borderwidth': 2,
             'bordercolor': "#e5e7eb",
@@ -265,9 +445,14 @@ def create_gauge_chart(score, title):
 
 def create_component_bar_chart(scores):
     """Create horizontal bar chart for component scores"""
+    return _component_bar_chart(scores['age'], scores['vehicle'], scores['location'], scores['gender'])
+
+@st.cache_resource(max_entries=1024, show_spinner=False)
+def _component_bar_chart(age, vehicle, location, gender):
+    """Build the component bar chart for one score combination (cached)"""
     components = ['Age', 'Vehicle', 'Location', 'Gender']
-    values = [scores['age'], scores['vehicle'], scores['location'], scores['gender']]
-    colors = [get_risk_level_info(v)['color'] for v in values]
+    values = [age, vehicle, location, gender]
+    colors = [RISK_COLORS[v] for v in values]
     
     fig = go.Figure(go.Bar(
         x=values,
@@ -297,8 +482,9 @@ def create_component_bar_chart(scores):
     
     return fig
 
+@st.cache_resource(show_spinner=False)
 def create_weight_pie_chart():
-    """Create pie chart showing model weights"""
+    """Create pie chart showing model weights (cached; the weights never change at runtime)"""
     labels = ['Age', 'Vehicle', 'Location', 'Gender']
     values = weights * 100  # Convert to percentages
     colors = ['#667eea', '#764ba2', '#f093fb', '#f5576c']
@@ -347,46 +533,49 @@ def main():
     with st.sidebar:
         st.header("📋 Applicant Information")
         
-        # Age input
-        st.subheader("👤 Driver Information")
-        actual_age = st.slider("Driver Age", 18, 99, 30, help="Select the driver's age")
-        age_category = age_to_category(actual_age)
-        st.caption(f"Age Category: {age_category} (1=youngest, 6=oldest)")
-        
-        gender = st.selectbox("Gender", ["M", "F"], format_func=lambda x: "Male" if x == "M" else "Female")
-        
-        # Vehicle information
-        st.subheader("🚙 Vehicle Information")
-        vehicle_value = st.slider("Vehicle Value", 1, 10, 5, 
-                                  help="1=lowest value (~$5k), 10=highest value (~$80k+)")
-        
-        vehicle_age = st.select_slider("Vehicle Age", 
-                                       options=[1, 2, 3, 4],
-                                       value=2,
-                                       format_func=lambda x: {
-                                           1: "0-2 years (newest)",
-                                           2: "3-5 years",
-                                           3: "6-10 years",
-                                           4: "11+ years (oldest)"
-                                       }[x])
-        
-        vehicle_body = st.selectbox("Vehicle Body Type", 
-                                   sorted(le_body.classes_),
-                                   index=list(sorted(le_body.classes_)).index('SEDAN') if 'SEDAN' in le_body.classes_ else 0)
-        
-        # Location
-        st.subheader("📍 Location")
-        area = st.select_slider("Geographic Area",
-                               options=sorted(le_area.classes_),
-                               value='C',
-                               format_func=lambda x: f"{x} ({'Urban' if x in ['A','B'] else 'Suburban' if x in ['C','D'] else 'Rural'})")
-        
-        st.markdown("---")
-        calculate_button = st.button("🎯 Calculate Risk Score", use_container_width=True)
+        # Inputs are batched in a form: changing a widget does not rerun the
+        # script, only the submit button does
+        with st.form("risk_form"):
+            # Age input
+            st.subheader("👤 Driver Information")
+            actual_age = st.slider("Driver Age", 18, 99, 30, help="Select the driver's age")
+            age_category = age_to_category(actual_age)
+            st.caption(f"Age Category: {age_category} (1=youngest, 6=oldest)")
+            
+            gender = st.selectbox("Gender", ["M", "F"], format_func=lambda x: "Male" if x == "M" else "Female")
+            
+            # Vehicle information
+            st.subheader("🚙 Vehicle Information")
+            vehicle_value = st.slider("Vehicle Value", 1, 10, 5, 
+                                      help="1=lowest value (~$5k), 10=highest value (~$80k+)")
+            
+            vehicle_age = st.select_slider("Vehicle Age", 
+                                           options=[1, 2, 3, 4],
+                                           value=2,
+                                           format_func=lambda x: {
+                                               1: "0-2 years (newest)",
+                                               2: "3-5 years",
+                                               3: "6-10 years",
+                                               4: "11+ years (oldest)"
+                                           }[x])
+            
+            vehicle_body = st.selectbox("Vehicle Body Type", 
+                                       sorted(le_body.classes_),
+                                       index=list(sorted(le_body.classes_)).index('SEDAN') if 'SEDAN' in le_body.classes_ else 0)
+            
+            # Location
+            st.subheader("📍 Location")
+            area = st.select_slider("Geographic Area",
+                                   options=sorted(le_area.classes_),
+                                   value='C',
+                                   format_func=lambda x: f"{x} ({'Urban' if x in ['A','B'] else 'Suburban' if x in ['C','D'] else 'Rural'})")
+            
+            st.markdown("---")
+            calculate_button = st.form_submit_button("🎯 Calculate Risk Score", use_container_width=True)
     
     # Main content area
-    if calculate_button or 'scores' in st.session_state:
-        # Calculate scores
+    if calculate_button:
+        # Score only on submit; other reruns reuse the stored result
         scores = get_all_risk_scores(age_category, vehicle_value, vehicle_age, vehicle_body, area, gender)
         
         if scores is None:
@@ -394,6 +583,9 @@ def main():
             return
         
         st.session_state['scores'] = scores
+    
+    if 'scores' in st.session_state:
+        scores = st.session_state['scores']
         
         # Display final risk score prominently
         risk_info = get_risk_level_info(scores['final_weighted'])
@@ -446,32 +638,11 @@ def main():
             st.plotly_chart(create_component_bar_chart(scores), use_container_width=True)
         
         with col2:
-            st.plotly_chart(create_weight_pie_chart(), use_container_width=True)
+            st.plotly_chart(create_weight_pie_chart(), use_container_width=True, config=STATIC_CHART_CONFIG)
         
         # Detailed breakdown
         with st.expander("📋 View Detailed Breakdown"):
-            st.markdown("### Input Summary")
-            input_df = pd.DataFrame({
-                'Category': ['Driver Age', 'Gender', 'Vehicle Value', 'Vehicle Age', 'Vehicle Type', 'Area'],
-                'Value': [
-                    f"{actual_age} years (Category {age_category})",
-                    "Male" if gender == "M" else "Female",
-                    f"{vehicle_value}/10",
-                    {1: "0-2 years", 2: "3-5 years", 3: "6-10 years", 4: "11+ years"}[vehicle_age],
-                    vehicle_body,
-                    f"{area} ({'Urban' if area in ['A','B'] else 'Suburban' if area in ['C','D'] else 'Rural'})"
-                ]
-            })
-            st.dataframe(input_df, use_container_width=True, hide_index=True)
-            
-            st.markdown("### Score Breakdown")
-            score_df = pd.DataFrame({
-                'Component': ['Age', 'Vehicle', 'Location', 'Gender', 'Final (Weighted)'],
-                'Risk Score': [scores['age'], scores['vehicle'], scores['location'], 
-                              scores['gender'], scores['final_weighted']],
-                'Weight': [f"{w*100:.1f}%" for w in weights] + ['100%']
-            })
-            st.dataframe(score_df, use_container_width=True, hide_index=True)
+            breakdown_panel(scores, actual_age, age_category, gender, vehicle_value, vehicle_age, vehicle_body, area)
     
     else:
         # Initial state - show instructions
@@ -507,7 +678,38 @@ def main():
             """)
         
         st.markdown("---")
-        st.plotly_chart(create_weight_pie_chart(), use_container_width=True)
+        st.plotly_chart(create_weight_pie_chart(), use_container_width=True, config=STATIC_CHART_CONFIG)
+
+@st.fragment
+def breakdown_panel(scores, actual_age, age_category, gender, vehicle_value, vehicle_age, vehicle_body, area):
+    """Input and score tables, built only once the user asks for them"""
+    # Streamlit does not report whether an expander is open, so the tables
+    # sit behind a toggle; flipping it reruns only this fragment
+    if not st.toggle("Show tables", key="show_breakdown"):
+        return
+    
+    st.markdown("### Input Summary")
+    input_df = pd.DataFrame({
+        'Category': ['Driver Age', 'Gender', 'Vehicle Value', 'Vehicle Age', 'Vehicle Type', 'Area'],
+        'Value': [
+            f"{actual_age} years (Category {age_category})",
+            "Male" if gender == "M" else "Female",
+            f"{vehicle_value}/10",
+            {1: "0-2 years", 2: "3-5 years", 3: "6-10 years", 4: "11+ years"}[vehicle_age],
+            vehicle_body,
+            f"{area} ({'Urban' if area in ['A','B'] else 'Suburban' if area in ['C','D'] else 'Rural'})"
+        ]
+    })
+    st.dataframe(input_df, use_container_width=True, hide_index=True)
+    
+    st.markdown("### Score Breakdown")
+    score_df = pd.DataFrame({
+        'Component': ['Age', 'Vehicle', 'Location', 'Gender', 'Final (Weighted)'],
+        'Risk Score': [scores['age'], scores['vehicle'], scores['location'], 
+                      scores['gender'], scores['final_weighted']],
+        'Weight': [f"{w*100:.1f}%" for w in weights] + ['100%']
+    })
+    st.dataframe(score_df, use_container_width=True, hide_index=True)
 
 # ============================================
 # BATCH SCORING TAB (BONUS)
@@ -530,40 +732,25 @@ def batch_scoring_page():
     })
     st.dataframe(sample_df, use_container_width=True)
     
+    # Upload and scoring run as a fragment, so its widgets rerun only that panel
+    batch_upload_panel()
+
+@st.fragment
+def batch_upload_panel():
+    """Upload a CSV, score it and show the results"""
     # File uploader
     uploaded_file = st.file_uploader("Upload CSV file", type=['csv'])
     
     if uploaded_file is not None:
         try:
-            df = pd.read_csv(uploaded_file)
+            df = pd.read_csv(uploaded_file, dtype=BATCH_CSV_DTYPES, engine='c')
             
             st.success(f"✅ Loaded {len(df)} applicants")
             
             if st.button("Calculate All Scores"):
                 with st.spinner("Calculating scores..."):
-                    results = []
-                    
-                    for idx, row in df.iterrows():
-                        scores = get_all_risk_scores(
-                            row['age_category'],
-                            row['vehicle_value'],
-                            row['vehicle_age'],
-                            row['vehicle_body'],
-                            row['area'],
-                            row['gender']
-                        )
-                        
-                        if scores:
-                            results.append({
-                                'applicant_id': idx + 1,
-                                'age_risk': scores['age'],
-                                'vehicle_risk': scores['vehicle'],
-                                'location_risk': scores['location'],
-                                'gender_risk': scores['gender'],
-                                'final_risk': scores['final_weighted']
-                            })
-                    
-                    results_df = pd.DataFrame(results)
+                    # Whole-column scoring; no per-row Python loop
+                    results_df = get_batch_risk_scores(df)
                     
                     st.subheader("Results")
                     st.dataframe(results_df, use_container_width=True)
@@ -591,7 +778,9 @@ def batch_scoring_page():
                         st.metric("Low Risk Count", 
                                  f"{len(results_df[results_df['final_risk'] < 30])}")
                     
-                    # Distribution chart
+                    # Distribution chart; plotly.express is only needed here, so it is
+                    # imported on first use rather than on every cold start
+                    import plotly.express as px
                     fig = px.histogram(results_df, x='final_risk', nbins=20,
                                       title="Risk Score Distribution",
                                       labels={'final_risk': 'Risk Score', 'count': 'Number of Applicants'})
@@ -24,13 +24,24 @@ print(f"Claim rate: {df_car['clm'].mean():.2%}")
 # Convert categorical to numeric if needed
 from sklearn.preprocessing import LabelEncoder
 
-le_body = LabelEncoder()
-le_gender = LabelEncoder()
-le_area = LabelEncoder()
-
-df_car['veh_body_encoded'] = le_body.fit_transform(df_car['veh_body'])
-df_car['gender_encoded'] = le_gender.fit_transform(df_car['gender'])
-df_car['area_encoded'] = le_area.fit_transform(df_car['area'])
+def encode_categorical(column):
+    """
+    Encode a column via pandas' hash-based factorize instead of LabelEncoder's
+    sort-based fit. Categories come out sorted, so the codes match what
+    LabelEncoder.fit_transform would produce; the returned LabelEncoder is
+    fitted by setting classes_ so the pickled models stay compatible.
+    """
+    categorical = pd.Categorical(column)
+    encoder = LabelEncoder()
+    encoder.classes_ = categorical.categories.to_numpy()
+    return categorical.codes, encoder
+
+df_car['veh_body_encoded'], le_body = encode_categorical(df_car['veh_body'])
+df_car['gender_encoded'], le_gender = encode_categorical(df_car['gender'])
+df_car['area_encoded'], le_area = encode_categorical(df_car['area'])
+
+# Claim indicator shared by every model below, extracted once
+y_freq = df_car['clm'].to_numpy()
 
 # ============================================
 # COMPONENT 1: DRIVER AGE MODEL
@@ -41,11 +52,10 @@ print("COMPONENT 1: Driver Age Model")
 print("="*50)
 
 X_age = df_car[['agecat']]
-y_freq = df_car['clm']
 
 X_train, X_test, y_train, y_test = train_test_split(X_age, y_freq, test_size=0.2, random_state=42)
 
-age_model = RandomForestClassifier(n_estimators=100, max_depth=3, random_state=42)
+age_model = RandomForestClassifier(n_estimators=100, max_depth=3, random_state=42, n_jobs=-1)
 age_model.fit(X_train, y_train)
 
 age_risk_scores = age_model.predict_proba(X_test)[:, 1]
@@ -53,7 +63,7 @@ print(f"Age Model AUC: {roc_auc_score(y_test, age_risk_scores):.4f}")
 
 # Analyze age effect
 print("\nClaim Rate by Age Category:")
-print(df_car.groupby('agecat')['clm'].agg(['mean', 'count']))
+print(df_car.groupby('agecat', sort=False, observed=True)['clm'].agg(['mean', 'count']))
 
 # ============================================
 # COMPONENT 2: VEHICLE MODEL
@@ -64,11 +74,10 @@ print("COMPONENT 2: Vehicle Characteristics Model")
 print("="*50)
 
 X_vehicle = df_car[['veh_value', 'veh_age', 'veh_body_encoded']]
-y_freq = df_car['clm']
 
 X_train, X_test, y_train, y_test = train_test_split(X_vehicle, y_freq, test_size=0.2, random_state=42)
 
-vehicle_model = RandomForestClassifier(n_estimators=100, max_depth=5, random_state=42)
+vehicle_model = RandomForestClassifier(n_estimators=100, max_depth=5, random_state=42, n_jobs=-1)
 vehicle_model.fit(X_train, y_train)
 
 vehicle_risk_scores = vehicle_model.predict_proba(X_test)[:, 1]
@@ -88,18 +97,17 @@ print("COMPONENT 3: Geographic Location Model")
 print("="*50)
 
 X_location = df_car[['area_encoded']]
-y_freq = df_car['clm']
 
 X_train, X_test, y_train, y_test = train_test_split(X_location, y_freq, test_size=0.2, random_state=42)
 
-location_model = RandomForestClassifier(n_estimators=100, max_depth=3, random_state=42)
+location_model = RandomForestClassifier(n_estimators=100, max_depth=3, random_state=42, n_jobs=-1)
 location_model.fit(X_train, y_train)
 
 location_risk_scores = location_model.predict_proba(X_test)[:, 1]
 print(f"Location Model AUC: {roc_auc_score(y_test, location_risk_scores):.4f}")
 
 print("\nClaim Rate by Area:")
-print(df_car.groupby('area')['clm'].agg(['mean', 'count']))
+print(df_car.groupby('area', sort=False, observed=True)['clm'].agg(['mean', 'count']))
 
 # ============================================
 # COMPONENT 4: GENDER MODEL (demographic)
@@ -110,18 +118,17 @@ print("COMPONENT 4: Driver Gender Model")
 print("="*50)
 
 X_gender = df_car[['gender_encoded']]
-y_freq = df_car['clm']
 
 X_train, X_test, y_train, y_test = train_test_split(X_gender, y_freq, test_size=0.2, random_state=42)
 
-gender_model = RandomForestClassifier(n_estimators=100, max_depth=2, random_state=42)
+gender_model = RandomForestClassifier(n_estimators=100, max_depth=2, random_state=42, n_jobs=-1)
 gender_model.fit(X_train, y_train)
 
 gender_risk_scores = gender_model.predict_proba(X_test)[:, 1]
 print(f"Gender Model AUC: {roc_auc_score(y_test, gender_risk_scores):.4f}")
 
 print("\nClaim Rate by Gender:")
-print(df_car.groupby('gender')['clm'].agg(['mean', 'count']))
+print(df_car.groupby('gender', sort=False, observed=True)['clm'].agg(['mean', 'count']))
 
 # ============================================
 # COMBINE COMPONENTS: WEIGHTED ENSEMBLE
@@ -134,7 +141,7 @@ print("="*50)
 # Prepare full dataset
 X_full = df_car[['agecat', 'veh_value', 'veh_age', 'veh_body_encoded', 
                  'area_encoded', 'gender_encoded']]
-y_full = df_car['clm']
+y_full = y_freq
 
 X_train_full, X_test_full, y_train_full, y_test_full = train_test_split(
     X_full, y_full, test_size=0.2, random_state=42
@@ -180,7 +187,7 @@ print(f"\n🎯 Ensemble AUC: {ensemble_auc:.4f}")
 
 # Compare to single model
 from sklearn.ensemble import RandomForestClassifier
-single_model = RandomForestClassifier(n_estimators=200, max_depth=10, random_state=42)
+single_model = RandomForestClassifier(n_estimators=200, max_depth=10, random_state=42, n_jobs=-1)
 single_model.fit(X_train_full, y_train_full)
 single_scores = single_model.predict_proba(X_test_full)[:, 1]
 single_auc = roc_auc_score(y_test_full, single_scores)
@@ -188,6 +195,39 @@ single_auc = roc_auc_score(y_test_full, single_scores)
 print(f"📊 Single Model AUC: {single_auc:.4f}")
 print(f"✨ Improvement: {(ensemble_auc - single_auc)*100:+.2f} percentage points")
 
+# ============================================
+# PRECOMPUTE SCORE TABLES
+# ============================================
+
+# The apps only feed the component models small discrete grids, so score
+# every grid point once here and ship the tables with the models; scoring
+# an applicant then becomes an array index instead of a predict_proba call.
+# Scores are truncated like int(prob * 100) and fit in uint8 (0-100).
+AGE_CATEGORY_COUNT = 6
+VEHICLE_VALUE_COUNT = 10
+VEHICLE_AGE_COUNT = 4
+
+def score_table(model, rows):
+    return (model.predict_proba(np.asarray(rows))[:, 1] * 100).astype(np.uint8)
+
+n_body = len(le_body.classes_)
+vehicle_grid = np.array(np.meshgrid(
+    np.arange(1, VEHICLE_VALUE_COUNT + 1),
+    np.arange(1, VEHICLE_AGE_COUNT + 1),
+    np.arange(n_body),
+    indexing='ij'
+)).reshape(3, -1).T
+
+score_tables = {
+    'age': score_table(age_model, np.arange(1, AGE_CATEGORY_COUNT + 1).reshape(-1, 1)),
+    # Indexed [veh_value - 1, veh_age - 1, veh_body_encoded]
+    'vehicle': score_table(vehicle_model, vehicle_grid).reshape(VEHICLE_VALUE_COUNT, VEHICLE_AGE_COUNT, n_body),
+    'location': score_table(location_model, np.arange(len(le_area.classes_)).reshape(-1, 1)),
+    'gender': score_table(gender_model, np.arange(len(le_gender.classes_)).reshape(-1, 1))
+}
+
+print(f"\n📋 Score tables: {sum(t.size for t in score_tables.values())} precomputed inputs")
+
 # ============================================
 # SAVE COMPONENT MODELS
 # ============================================
@@ -200,6 +240,7 @@ models = {
     'location_model': location_model,
     'gender_model': gender_model,
     'weights': weights,
+    'score_tables': score_tables,
     'label_encoders': {
         'veh_body': le_body,
         'gender': le_gender,
@@ -210,4 +251,21 @@ models = {
 with open('component_models.pkl', 'wb') as f:
     pickle.dump(models, f)
 
-print("\n✅ Component models saved to 'component_models.pkl'")
\ No newline at end of file
+print("\n✅ Component models saved to 'component_models.pkl'")
+
+# Serving file for risk_calculator.py: only the score tables, weights and
+# class names, so loading skips deserializing the forests entirely
+serving_models = {
+    'weights': weights,
+    'score_tables': score_tables,
+    'classes': {
+        'veh_body': le_body.classes_,
+        'gender': le_gender.classes_,
+        'area': le_area.classes_
+    }
+}
+
+with open('serving_models.pkl', 'wb') as f:
+    pickle.dump(serving_models, f)
+
+print("✅ Serving tables saved to 'serving_models.pkl'")
\ No newline at end of file
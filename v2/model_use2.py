@@ -8,6 +8,7 @@ import pandas as pd
 import numpy as np
 import pickle
 import warnings
+from functools import lru_cache
 
 # Suppress sklearn feature name warnings
 warnings.filterwarnings('ignore', category=UserWarning, module='sklearn')
@@ -35,6 +36,12 @@ le_gender = models['label_encoders']['gender']
 le_area = models['label_encoders']['area']
 weights = models['weights']
 
+# Label encoders as plain dicts: encoding becomes one hash lookup instead of
+# a LabelEncoder.transform call with its validation and array conversions
+BODY_IDX = {c: i for i, c in enumerate(le_body.classes_)}
+AREA_IDX = {c: i for i, c in enumerate(le_area.classes_)}
+GENDER_IDX = {c: i for i, c in enumerate(le_gender.classes_)}
+
 # ============================================
 # RESCALING FUNCTION
 # ============================================
@@ -60,6 +67,77 @@ def rescale_to_100(raw_score, min_observed=3, max_observed=15):
     rescaled = ((raw_score - min_observed) / (max_observed - min_observed)) * 99 + 1
     return int(np.clip(rescaled, 1, 100))
 
+
+def rescale_scores_to_100(raw_scores, min_observed=3, max_observed=15):
+    """
+    Array version of rescale_to_100
+    
+    Parameters:
+    - raw_scores: array of raw probability * 100 values
+    - min_observed, max_observed: as in rescale_to_100
+    
+    Returns:
+    - int array of rescaled scores from 1-100
+    """
+    # Clipping the linear rescale covers both early returns of rescale_to_100
+    rescaled = ((np.asarray(raw_scores) - min_observed) / (max_observed - min_observed)) * 99 + 1
+    return np.clip(rescaled, 1, 100).astype(int)
+
+
+def _model_scores(model, columns):
+    """Rescaled scores for a dict of feature columns from one predict_proba call"""
+    return rescale_scores_to_100(model.predict_proba(pd.DataFrame(columns))[:, 1] * 100)
+
+# ============================================
+# PRECOMPUTED SCORE TABLES
+# ============================================
+
+# Whole-number input grids covered by the score tables, each starting at 1
+AGE_CATEGORY_COUNT = 6
+VEHICLE_VALUE_COUNT = 10
+VEHICLE_AGE_COUNT = 4
+
+def build_score_tables():
+    """Rescaled score for every grid input, one batched predict_proba call per model"""
+    value, age, body = np.meshgrid(np.arange(1, VEHICLE_VALUE_COUNT + 1),
+                                   np.arange(1, VEHICLE_AGE_COUNT + 1),
+                                   np.arange(len(le_body.classes_)), indexing='ij')
+    vehicle = _model_scores(vehicle_model, {'veh_value': value.ravel(),
+                                            'veh_age': age.ravel(),
+                                            'veh_body_encoded': body.ravel()})
+    
+    return {
+        'age': _model_scores(age_model, {'agecat': np.arange(1, AGE_CATEGORY_COUNT + 1)}).astype(np.uint8),
+        'vehicle': vehicle.reshape(value.shape).astype(np.uint8),
+        'location': _model_scores(location_model, {'area_encoded': np.arange(len(le_area.classes_))}).astype(np.uint8),
+        'gender': _model_scores(gender_model, {'gender_encoded': np.arange(len(le_gender.classes_))}).astype(np.uint8)
+    }
+
+# The models only ever see this small discrete input space, so each component
+# is scored once here and single/batch scoring becomes an array index.
+# The tables in component_models.pkl hold unrescaled scores, hence rebuilding.
+score_tables = build_score_tables()
+AGE_SCORES = score_tables['age']
+VEHICLE_SCORES = score_tables['vehicle']
+LOCATION_SCORES = score_tables['location']
+GENDER_SCORES = score_tables['gender']
+
+
+def _grid_index(value, count):
+    """Zero-based table index for a whole number in 1..count, or None if off the grid"""
+    try:
+        index = int(value)
+    except (TypeError, ValueError):
+        return None
+    if index == value and 1 <= index <= count:
+        return index - 1
+    return None
+
+
+def _on_grid(values, count):
+    """Mask of whole numbers in 1..count (vectorized counterpart of _grid_index)"""
+    return (values == np.floor(values)) & (values >= 1) & (values <= count)
+
 # ============================================
 # INDIVIDUAL COMPONENT SCORING FUNCTIONS
 # ============================================
@@ -80,6 +158,11 @@ def get_age_risk_score(age_category):
     Returns:
     - risk_score: int (1-100)
     """
+    index = _grid_index(age_category, AGE_CATEGORY_COUNT)
+    if index is not None:
+        return int(AGE_SCORES[index])
+    
+    # Off the table grid: fall back to the model
     # Create DataFrame with feature names to avoid sklearn warning
     input_df = pd.DataFrame([[age_category]], columns=['agecat'])
     prob = age_model.predict_proba(input_df)[0, 1]
@@ -103,13 +186,18 @@ def get_vehicle_risk_score(vehicle_value, vehicle_age, vehicle_body):
     Returns:
     - risk_score: int (1-100)
     """
-    try:
-        body_encoded = le_body.transform([vehicle_body.upper()])[0]
-    except ValueError:
+    body_encoded = BODY_IDX.get(vehicle_body.upper())
+    if body_encoded is None:
         print(f"Unknown vehicle body type: {vehicle_body}")
         print(f"Valid types: {list(le_body.classes_)}")
         return None
     
+    value_index = _grid_index(vehicle_value, VEHICLE_VALUE_COUNT)
+    age_index = _grid_index(vehicle_age, VEHICLE_AGE_COUNT)
+    if value_index is not None and age_index is not None:
+        return int(VEHICLE_SCORES[value_index, age_index, body_encoded])
+    
+    # Off the table grid: fall back to the model
     # Create DataFrame with feature names
     input_df = pd.DataFrame([[vehicle_value, vehicle_age, body_encoded]], 
                            columns=['veh_value', 'veh_age', 'veh_body_encoded'])
@@ -130,18 +218,13 @@ def get_location_risk_score(area):
     Returns:
     - risk_score: int (1-100)
     """
-    try:
-        area_encoded = le_area.transform([area.upper()])[0]
-    except ValueError:
+    area_encoded = AREA_IDX.get(area.upper())
+    if area_encoded is None:
         print(f"Unknown area: {area}")
         print(f"Valid areas: {list(le_area.classes_)}")
         return None
     
-    # Create DataFrame with feature names
-    input_df = pd.DataFrame([[area_encoded]], columns=['area_encoded'])
-    prob = location_model.predict_proba(input_df)[0, 1]
-    raw_score = prob * 100
-    return rescale_to_100(raw_score)
+    return int(LOCATION_SCORES[area_encoded])
 
 
 def get_gender_risk_score(gender):
@@ -154,24 +237,29 @@ def get_gender_risk_score(gender):
     Returns:
     - risk_score: int (1-100)
     """
-    try:
-        gender_encoded = le_gender.transform([gender.upper()])[0]
-    except ValueError:
+    gender_encoded = GENDER_IDX.get(gender.upper())
+    if gender_encoded is None:
         print(f"Unknown gender: {gender}")
         print(f"Valid genders: {list(le_gender.classes_)}")
         return None
     
-    # Create DataFrame with feature names
-    input_df = pd.DataFrame([[gender_encoded]], columns=['gender_encoded'])
-    prob = gender_model.predict_proba(input_df)[0, 1]
-    raw_score = prob * 100
-    return rescale_to_100(raw_score)
+    return int(GENDER_SCORES[gender_encoded])
 
 
 # ============================================
 # COMBINED SCORING FUNCTION
 # ============================================
 
+def weighted_final_score(age, vehicle, location, gender):
+    """
+    Weighted sum of the component scores using the learned weights
+    
+    Works on plain ints and on NumPy arrays alike; one expression for both
+    keeps single and batch final scores identical.
+    """
+    return age * weights[0] + vehicle * weights[1] + location * weights[2] + gender * weights[3]
+
+
 def get_all_risk_scores(age_category, vehicle_value, vehicle_age, vehicle_body, area, gender):
     """
     Get risk scores from all component models
@@ -200,10 +288,8 @@ def get_all_risk_scores(age_category, vehicle_value, vehicle_age, vehicle_body,
         return None
     
     # Calculate weighted final score using learned weights
-    component_array = np.array([scores['age'], scores['vehicle'], 
-                                scores['location'], scores['gender']])
-    
-    final_score = int(np.dot(component_array, weights))
+    final_score = int(weighted_final_score(scores['age'], scores['vehicle'],
+                                           scores['location'], scores['gender']))
     scores['final_weighted'] = final_score
     
     return scores
@@ -219,19 +305,6 @@ def display_risk_scores(scores):
         print("Could not calculate scores due to invalid input")
         return
     
-    print("\n" + "="*60)
-    print("INDIVIDUAL COMPONENT RISK SCORES (1-100)")
-    print("="*60)
-    
-    print(f"\nAge Risk Score:        {scores['age']:3d}/100")
-    print(f"Vehicle Risk Score:    {scores['vehicle']:3d}/100")
-    print(f"Location Risk Score:   {scores['location']:3d}/100")
-    print(f"Gender Risk Score:     {scores['gender']:3d}/100")
-    
-    print("\n" + "-"*60)
-    print(f"FINAL WEIGHTED SCORE:  {scores['final_weighted']:3d}/100")
-    print("-"*60)
-    
     # Risk interpretation (no premium tiers)
     final = scores['final_weighted']
     if final < 30:
@@ -243,13 +316,29 @@ def display_risk_scores(scores):
     else:
         risk_level = "VERY HIGH RISK"
     
-    print(f"\nRisk Level: {risk_level}")
+    # Whole report in one print call
+    print("\n".join([
+        "\n" + "="*60,
+        "INDIVIDUAL COMPONENT RISK SCORES (1-100)",
+        "="*60,
+        f"\nAge Risk Score:        {scores['age']:3d}/100",
+        f"Vehicle Risk Score:    {scores['vehicle']:3d}/100",
+        f"Location Risk Score:   {scores['location']:3d}/100",
+        f"Gender Risk Score:     {scores['gender']:3d}/100",
+        "\n" + "-"*60,
+        f"FINAL WEIGHTED SCORE:  {scores['final_weighted']:3d}/100",
+        "-"*60,
+        f"\nRisk Level: {risk_level}"
+    ]))
 
 
 # ============================================
 # HELPER FUNCTIONS
 # ============================================
 
+# First age of categories 2-6; the category is 1 + the number of cutoffs <= age
+_AGE_CUTOFFS = np.array([26, 36, 46, 56, 66])
+
 def age_to_category(actual_age):
     """
     Convert actual age to category
@@ -260,57 +349,93 @@ def age_to_category(actual_age):
     Returns:
     - category: int (1-6)
     """
-    if actual_age < 26:
-        return 1
-    elif actual_age < 36:
-        return 2
-    elif actual_age < 46:
-        return 3
-    elif actual_age < 56:
-        return 4
-    elif actual_age < 66:
-        return 5
-    else:
-        return 6
+    return int(np.searchsorted(_AGE_CUTOFFS, actual_age, side='right')) + 1
 
 
-def show_all_age_scores():
-    """Display risk scores for all age categories"""
-    print("\n" + "="*60)
-    print("AGE RISK SCORES FOR ALL CATEGORIES")
-    print("="*60)
+def age_to_category_vec(ages):
+    """
+    Convert an array of actual ages to categories
+    
+    Parameters:
+    - ages: array-like of ints (18-99)
+    
+    Returns:
+    - int array of categories (1-6)
+    """
+    return np.searchsorted(_AGE_CUTOFFS, ages, side='right') + 1
+
+
+# The reference tables are built as one string and printed in a single call;
+# the age and area tables take no arguments, so their text is built once
+
+@lru_cache(maxsize=None)
+def _age_scores_text():
+    """Text of the age category score table"""
+    lines = ["\n" + "="*60, "AGE RISK SCORES FOR ALL CATEGORIES", "="*60]
     age_ranges = ["18-25", "26-35", "36-45", "46-55", "56-65", "66+"]
     for cat in range(1, 7):
         score = get_age_risk_score(cat)
-        print(f"Category {cat} ({age_ranges[cat-1]:>6s}): {score:3d}/100")
+        lines.append(f"Category {cat} ({age_ranges[cat-1]:>6s}): {score:3d}/100")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _areas_text():
+    """Text of the geographic area score table"""
+    lines = ["\n" + "="*60, "GEOGRAPHIC AREA RISK SCORES", "="*60]
+    for area in le_area.classes_:
+        score = get_location_risk_score(area)
+        lines.append(f"Area {area}: {score:3d}/100")
+    return "\n".join(lines)
+
+
+def show_all_age_scores():
+    """Display risk scores for all age categories"""
+    print(_age_scores_text())
 
 
 def show_all_vehicle_bodies(vehicle_value=5, vehicle_age=2):
     """Display risk scores for all vehicle body types"""
-    print("\n" + "="*60)
-    print(f"VEHICLE BODY TYPE RISK SCORES")
-    print(f"(value={vehicle_value}, age={vehicle_age})")
-    print("="*60)
-    for body_type in le_body.classes_:
-        score = get_vehicle_risk_score(vehicle_value, vehicle_age, body_type)
-        if score is not None:
-            print(f"{body_type:10s}: {score:3d}/100")
+    lines = ["\n" + "="*60,
+             "VEHICLE BODY TYPE RISK SCORES",
+             f"(value={vehicle_value}, age={vehicle_age})",
+             "="*60]
+    
+    # One row of the score table holds every body type's score
+    value_index = _grid_index(vehicle_value, VEHICLE_VALUE_COUNT)
+    age_index = _grid_index(vehicle_age, VEHICLE_AGE_COUNT)
+    if value_index is not None and age_index is not None:
+        scores = VEHICLE_SCORES[value_index, age_index]
+    else:
+        # Off the table grid: score all body types in one model call
+        n_body = len(le_body.classes_)
+        scores = _model_scores(vehicle_model, {'veh_value': np.full(n_body, vehicle_value),
+                                               'veh_age': np.full(n_body, vehicle_age),
+                                               'veh_body_encoded': np.arange(n_body)})
+    
+    for body_type, score in zip(le_body.classes_, scores):
+        lines.append(f"{body_type:10s}: {int(score):3d}/100")
+    print("\n".join(lines))
 
 
 def show_all_areas():
     """Display risk scores for all geographic areas"""
-    print("\n" + "="*60)
-    print("GEOGRAPHIC AREA RISK SCORES")
-    print("="*60)
-    for area in le_area.classes_:
-        score = get_location_risk_score(area)
-        print(f"Area {area}: {score:3d}/100")
+    print(_areas_text())
 
 
 # ============================================
 # BATCH SCORING
 # ============================================
 
+def _encode_labels(column, encoder):
+    """Encoded classes for a column of labels, -1 where unknown or missing"""
+    # As a category column each distinct label is upper-cased and matched once;
+    # rows then just take their category's code (code -1, missing, stays -1)
+    column = column.astype('category')
+    category_codes = pd.Index(encoder.classes_).get_indexer(column.cat.categories.astype(str).str.upper())
+    return np.append(category_codes, -1)[column.cat.codes.to_numpy()]
+
+
 def batch_score_applicants(applicants_df):
     """
     Score multiple applicants at once
@@ -321,36 +446,115 @@ def batch_score_applicants(applicants_df):
     
     Returns:
     - DataFrame with risk score columns added
+    
+    Works on whole columns: scores are gathered from the precomputed tables,
+    and only inputs off the table grid go to a model, in one batched call.
+    Applicants with an unknown vehicle body, area or gender are skipped, as
+    get_all_risk_scores returns None for them.
     """
-    results = []
-    
-    for idx, row in applicants_df.iterrows():
-        scores = get_all_risk_scores(
-            row['age_category'],
-            row['vehicle_value'],
-            row['vehicle_age'],
-            row['vehicle_body'],
-            row['area'],
-            row['gender']
-        )
-        
-        if scores:
-            results.append({
-                'applicant_id': idx,
-                'age_risk': scores['age'],
-                'vehicle_risk': scores['vehicle'],
-                'location_risk': scores['location'],
-                'gender_risk': scores['gender'],
-                'final_risk': scores['final_weighted']
-            })
-    
-    return pd.DataFrame(results)
+    # Encode categoricals in one pass; unknown labels get code -1 and are
+    # reported once per distinct label, as the single-applicant scorers do
+    encoded = []
+    for col, encoder, name, plural in (('vehicle_body', le_body, "vehicle body type", "types"),
+                                       ('area', le_area, "area", "areas"),
+                                       ('gender', le_gender, "gender", "genders")):
+        codes = _encode_labels(applicants_df[col], encoder)
+        unknown = applicants_df[col][codes < 0].dropna().unique()
+        if len(unknown):
+            for label in unknown:
+                print(f"Unknown {name}: {label}")
+            print(f"Valid {plural}: {list(encoder.classes_)}")
+        encoded.append(codes)
+    body_encoded, area_encoded, gender_encoded = encoded
+    valid = (body_encoded >= 0) & (area_encoded >= 0) & (gender_encoded >= 0)
+    
+    skipped = int((~valid).sum())
+    if skipped:
+        print(f"Skipped {skipped} applicant(s) with an unknown vehicle body, area or gender")
+    
+    applicants = applicants_df[valid]
+    body_encoded, area_encoded, gender_encoded = body_encoded[valid], area_encoded[valid], gender_encoded[valid]
+    
+    if applicants.empty:
+        return pd.DataFrame(columns=['applicant_id', 'age_risk', 'vehicle_risk',
+                                     'location_risk', 'gender_risk', 'final_risk'])
+    
+    age_category = applicants['age_category'].to_numpy(dtype=float)
+    vehicle_value = applicants['vehicle_value'].to_numpy(dtype=float)
+    vehicle_age = applicants['vehicle_age'].to_numpy(dtype=float)
+    
+    # Component columns are preallocated as uint8 (scores are 1-100) and
+    # filled in place
+    n = len(applicants)
+    
+    # Age: table lookup on the grid, one batched model call for the rest
+    age_scores = np.empty(n, dtype=np.uint8)
+    on_grid = _on_grid(age_category, AGE_CATEGORY_COUNT)
+    age_scores[on_grid] = AGE_SCORES[age_category[on_grid].astype(np.intp) - 1]
+    if not on_grid.all():
+        off_grid = ~on_grid
+        age_scores[off_grid] = _model_scores(age_model, {'agecat': age_category[off_grid]})
+    
+    # Vehicle: same split over the value x age grid
+    vehicle_scores = np.empty(n, dtype=np.uint8)
+    on_grid = _on_grid(vehicle_value, VEHICLE_VALUE_COUNT) & _on_grid(vehicle_age, VEHICLE_AGE_COUNT)
+    vehicle_scores[on_grid] = VEHICLE_SCORES[vehicle_value[on_grid].astype(np.intp) - 1,
+                                             vehicle_age[on_grid].astype(np.intp) - 1,
+                                             body_encoded[on_grid]]
+    if not on_grid.all():
+        off_grid = ~on_grid
+        vehicle_scores[off_grid] = _model_scores(vehicle_model, {'veh_value': vehicle_value[off_grid],
+                                                                 'veh_age': vehicle_age[off_grid],
+                                                                 'veh_body_encoded': body_encoded[off_grid]})
+    
+    location_scores = LOCATION_SCORES[area_encoded]
+    gender_scores = GENDER_SCORES[gender_encoded]
+    # Fused over the component columns: no stacked (n, 4) matrix
+    final_scores = weighted_final_score(age_scores, vehicle_scores,
+                                        location_scores, gender_scores).astype(int)
+    
+    # Built straight from the column arrays, without copying them
+    return pd.DataFrame({
+        'applicant_id': applicants.index.to_numpy(),
+        'age_risk': age_scores,
+        'vehicle_risk': vehicle_scores,
+        'location_risk': location_scores,
+        'gender_risk': gender_scores,
+        'final_risk': final_scores
+    }, copy=False)
 
 
 # ============================================
 # INTERACTIVE CALCULATOR
 # ============================================
 
+# Choice lists shown in prompts, joined once
+_BODY_CHOICES = ", ".join(le_body.classes_)
+_AREA_CHOICES = ", ".join(le_area.classes_)
+_GENDER_CHOICES = ", ".join(le_gender.classes_)
+
+
+def _read_int(prompt, low, high):
+    """Prompt until the user enters a whole number from low to high"""
+    while True:
+        try:
+            value = int(input(prompt))
+        except ValueError:
+            value = None
+        if value is not None and low <= value <= high:
+            return value
+        print(f"   Please enter a whole number from {low} to {high}")
+
+
+def _read_choice(prompt, index, choices):
+    """Prompt until the user enters a known class label (case-insensitive)"""
+    while True:
+        value = input(prompt).strip().upper()
+        if value in index:
+            return value
+        print(f"   Please enter one of: {choices}")
+
+
 def interactive_calculator():
     """Interactive command-line risk calculator"""
     print("\n" + "="*60)
@@ -359,31 +563,31 @@ def interactive_calculator():
     
     # Get age
     print("\nDriver Age:")
-    actual_age = int(input("Enter age (18-99): "))
+    actual_age = _read_int("Enter age (18-99): ", 18, 99)
     age_category = age_to_category(actual_age)
     print(f"   Age category: {age_category}")
     
     # Get vehicle info
     print("\nVehicle Value:")
     print("   1-10 scale (1=lowest value ~$5k, 10=highest value ~$80k+)")
-    vehicle_value = int(input("Enter vehicle value (1-10): "))
+    vehicle_value = _read_int("Enter vehicle value (1-10): ", 1, 10)
     
     print("\nVehicle Age:")
     print("   1 = 0-2 years (newest)")
     print("   2 = 3-5 years")
     print("   3 = 6-10 years")
     print("   4 = 11+ years (oldest)")
-    vehicle_age = int(input("Enter vehicle age category (1-4): "))
+    vehicle_age = _read_int("Enter vehicle age category (1-4): ", 1, 4)
     
-    print(f"\nVehicle Body Types: {', '.join(le_body.classes_)}")
-    vehicle_body = input("Enter vehicle body type: ").upper()
+    print(f"\nVehicle Body Types: {_BODY_CHOICES}")
+    vehicle_body = _read_choice("Enter vehicle body type: ", BODY_IDX, _BODY_CHOICES)
     
     # Get location
     print("\nGeographic Area (A=urban/high risk, F=rural/low risk):")
-    area = input("Enter area (A-F): ").upper()
+    area = _read_choice("Enter area (A-F): ", AREA_IDX, _AREA_CHOICES)
     
     # Get gender
-    gender = input("\nEnter gender (M/F): ").upper()
+    gender = _read_choice("\nEnter gender (M/F): ", GENDER_IDX, _GENDER_CHOICES)
     
     # Calculate and display scores
     scores = get_all_risk_scores(age_category, vehicle_value, vehicle_age, 
@@ -397,7 +601,8 @@ def interactive_calculator():
 # MAIN DEMO
 # ============================================
 
-if __name__ == "__main__":
+def _demo():
+    """Worked examples, reference tables and a batch run"""
     print("="*60)
     print("INSURANCE RISK SCORE CALCULATOR")
     print("="*60)
@@ -457,13 +662,16 @@ if __name__ == "__main__":
     print("BATCH SCORING EXAMPLE")
     print("="*60)
     
+    # Typed columns: small ints, and categories (inferred from the values, so
+    # an unknown label such as 'SUV' is kept and reported by the batch scorer)
+    # that batch_score_applicants encodes without converting
     sample_applicants = pd.DataFrame({
-        'age_category': [1, 3, 5, 2, 6],
-        'vehicle_value': [5, 7, 4, 8, 6],
-        'vehicle_age': [2, 1, 3, 2, 2],
-        'vehicle_body': ['SEDAN', 'SUV', 'HBACK', 'TRUCK', 'SEDAN'],
-        'area': ['C', 'B', 'E', 'D', 'F'],
-        'gender': ['M', 'F', 'M', 'M', 'F']
+        'age_category': np.array([1, 3, 5, 2, 6], dtype=np.int8),
+        'vehicle_value': np.array([5, 7, 4, 8, 6], dtype=np.int8),
+        'vehicle_age': np.array([2, 1, 3, 2, 2], dtype=np.int8),
+        'vehicle_body': pd.Categorical(['SEDAN', 'SUV', 'HBACK', 'TRUCK', 'SEDAN']),
+        'area': pd.Categorical(['C', 'B', 'E', 'D', 'F']),
+        'gender': pd.Categorical(['M', 'F', 'M', 'M', 'F'])
     })
     
     batch_results = batch_score_applicants(sample_applicants)
@@ -472,4 +680,8 @@ if __name__ == "__main__":
     
     # Uncomment to run interactive calculator
     # print("\n\n")
-    # interactive_calculator()
\ No newline at end of file
+    # interactive_calculator()
+
+
+if __name__ == "__main__":
+    _demo()
\ No newline at end of file
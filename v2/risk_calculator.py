@@ -13,24 +13,92 @@ import pickle
 # ============================================
 
 def load_models():
-    """Load pickled models"""
-    with open('component_models.pkl', 'rb') as f:
-        models = pickle.load(f)
+    """
+    Load pickled models
+    
+    Prefers serving_models.pkl (score tables and class names only, a few KB,
+    written by model.py) over the full component_models.pkl with the forests.
+    """
+    for path in ('serving_models.pkl', 'component_models.pkl'):
+        try:
+            with open(path, 'rb') as f:
+                models = pickle.load(f)
+        except FileNotFoundError:
+            continue
+        
+        print(f"✅ Models loaded successfully from '{path}'!\n")
+        return models
     
-    print("✅ Models loaded successfully!\n")
-    return models
+    raise FileNotFoundError("Neither 'serving_models.pkl' nor 'component_models.pkl' was found")
 
 # Load models once at module level
 models = load_models()
-age_model = models['age_model']
-vehicle_model = models['vehicle_model']
-location_model = models['location_model']
-gender_model = models['gender_model']
-le_body = models['label_encoders']['veh_body']
-le_gender = models['label_encoders']['gender']
-le_area = models['label_encoders']['area']
+
+# Fitted forests only exist in component_models.pkl; with serving_models.pkl
+# these are None and inputs off the score-table grid are rejected
+age_model = models.get('age_model')
+vehicle_model = models.get('vehicle_model')
 weights = models['weights']
 
+# Class names of the categorical inputs
+if 'classes' in models:
+    classes = models['classes']
+else:
+    classes = {name: encoder.classes_ for name, encoder in models['label_encoders'].items()}
+BODY_CLASSES = classes['veh_body']
+GENDER_CLASSES = classes['gender']
+AREA_CLASSES = classes['area']
+
+# Label encoders as plain dicts: encoding becomes one hash lookup instead of
+# a LabelEncoder.transform call with its validation and array conversions
+BODY_IDX = {c: i for i, c in enumerate(BODY_CLASSES)}
+AREA_IDX = {c: i for i, c in enumerate(AREA_CLASSES)}
+GENDER_IDX = {c: i for i, c in enumerate(GENDER_CLASSES)}
+
+# Whole-number input grids covered by the score tables, each starting at 1
+AGE_CATEGORY_COUNT = 6
+VEHICLE_VALUE_COUNT = 10
+VEHICLE_AGE_COUNT = 4
+
+def build_score_tables(models):
+    """Score every grid input once (for model files saved without 'score_tables')"""
+    def table(model, rows):
+        return (model.predict_proba(np.asarray(rows))[:, 1] * 100).astype(np.uint8)
+    
+    n_body = len(models['label_encoders']['veh_body'].classes_)
+    vehicle_rows = [[value, age, body]
+                    for value in range(1, VEHICLE_VALUE_COUNT + 1)
+                    for age in range(1, VEHICLE_AGE_COUNT + 1)
+                    for body in range(n_body)]
+    
+    return {
+        'age': table(models['age_model'], [[c] for c in range(1, AGE_CATEGORY_COUNT + 1)]),
+        'vehicle': table(models['vehicle_model'], vehicle_rows).reshape(
+            VEHICLE_VALUE_COUNT, VEHICLE_AGE_COUNT, n_body),
+        'location': table(models['location_model'],
+                          [[i] for i in range(len(models['label_encoders']['area'].classes_))]),
+        'gender': table(models['gender_model'],
+                        [[i] for i in range(len(models['label_encoders']['gender'].classes_))])
+    }
+
+# Precomputed component scores (see model.py); scoring is an array index
+score_tables = models.get('score_tables') or build_score_tables(models)
+AGE_SCORES = score_tables['age']
+VEHICLE_SCORES = score_tables['vehicle']
+LOCATION_SCORES = score_tables['location']
+GENDER_SCORES = score_tables['gender']
+
+
+def _grid_index(value, count):
+    """Zero-based table index for a whole number in 1..count, or None if off the grid"""
+    try:
+        index = int(value)
+    except (TypeError, ValueError):
+        return None
+    if index == value and 1 <= index <= count:
+        return index - 1
+    return None
+
 # ============================================
 # INDIVIDUAL COMPONENT SCORING FUNCTIONS
 # ============================================
@@ -51,6 +119,15 @@ def get_age_risk_score(age_category):
     Returns:
     - risk_score: int (1-100)
     """
+    index = _grid_index(age_category, AGE_CATEGORY_COUNT)
+    if index is not None:
+        return int(AGE_SCORES[index])
+    
+    # Off the table grid: fall back to the model
+    if age_model is None:
+        print(f"⚠️  Age category outside the score table: {age_category}")
+        return None
+    
     prob = age_model.predict_proba([[age_category]])[0, 1]
     risk_score = int(prob * 100)
     return risk_score
@@ -72,11 +149,20 @@ def get_vehicle_risk_score(vehicle_value, vehicle_age, vehicle_body):
     Returns:
     - risk_score: int (1-100)
     """
-    try:
-        body_encoded = le_body.transform([vehicle_body.upper()])[0]
-    except ValueError:
+    body_encoded = BODY_IDX.get(vehicle_body.upper())
+    if body_encoded is None:
         print(f"⚠️  Unknown vehicle body type: {vehicle_body}")
-        print(f"    Valid types: {list(le_body.classes_)}")
+        print(f"    Valid types: {list(BODY_CLASSES)}")
+        return None
+    
+    value_index = _grid_index(vehicle_value, VEHICLE_VALUE_COUNT)
+    age_index = _grid_index(vehicle_age, VEHICLE_AGE_COUNT)
+    if value_index is not None and age_index is not None:
+        return int(VEHICLE_SCORES[value_index, age_index, body_encoded])
+    
+    # Off the table grid: fall back to the model
+    if vehicle_model is None:
+        print(f"⚠️  Vehicle value/age outside the score table: {vehicle_value}, {vehicle_age}")
         return None
     
     prob = vehicle_model.predict_proba([[vehicle_value, vehicle_age, body_encoded]])[0, 1]
@@ -96,16 +182,13 @@ def get_location_risk_score(area):
     Returns:
     - risk_score: int (1-100)
     """
-    try:
-        area_encoded = le_area.transform([area.upper()])[0]
-    except ValueError:
+    area_encoded = AREA_IDX.get(area.upper())
+    if area_encoded is None:
         print(f"⚠️  Unknown area: {area}")
-        print(f"    Valid areas: {list(le_area.classes_)}")
+        print(f"    Valid areas: {list(AREA_CLASSES)}")
         return None
     
-    prob = location_model.predict_proba([[area_encoded]])[0, 1]
-    risk_score = int(prob * 100)
-    return risk_score
+    return int(LOCATION_SCORES[area_encoded])
 
 
 def get_gender_risk_score(gender):
@@ -118,16 +201,13 @@ def get_gender_risk_score(gender):
     Returns:
     - risk_score: int (1-100)
     """
-    try:
-        gender_encoded = le_gender.transform([gender.upper()])[0]
-    except ValueError:
+    gender_encoded = GENDER_IDX.get(gender.upper())
+    if gender_encoded is None:
         print(f"⚠️  Unknown gender: {gender}")
-        print(f"    Valid genders: {list(le_gender.classes_)}")
+        print(f"    Valid genders: {list(GENDER_CLASSES)}")
         return None
     
-    prob = gender_model.predict_proba([[gender_encoded]])[0, 1]
-    risk_score = int(prob * 100)
-    return risk_score
+    return int(GENDER_SCORES[gender_encoded])
 
 
 # ============================================
@@ -258,7 +338,7 @@ def show_all_vehicle_bodies(vehicle_value=5, vehicle_age=2):
     print(f"VEHICLE BODY TYPE RISK SCORES")
     print(f"(value={vehicle_value}, age={vehicle_age})")
     print("="*60)
-    for body_type in le_body.classes_:
+    for body_type in BODY_CLASSES:
         score = get_vehicle_risk_score(vehicle_value, vehicle_age, body_type)
         print(f"{body_type:10s}: {score:3d}/100")
 
@@ -268,7 +348,7 @@ def show_all_areas():
     print("\n" + "="*60)
     print("GEOGRAPHIC AREA RISK SCORES")
     print("="*60)
-    for area in le_area.classes_:
+    for area in AREA_CLASSES:
         score = get_location_risk_score(area)
         print(f"Area {area}: {score:3d}/100")
 
@@ -290,15 +370,11 @@ def batch_score_applicants(applicants_df):
     """
     results = []
     
-    for idx, row in applicants_df.iterrows():
-        scores = get_all_risk_scores(
-            row['age_category'],
-            row['vehicle_value'],
-            row['vehicle_age'],
-            row['vehicle_body'],
-            row['area'],
-            row['gender']
-        )
+    # Plain tuples in get_all_risk_scores' argument order; no per-row Series
+    input_columns = ['age_category', 'vehicle_value', 'vehicle_age', 'vehicle_body', 'area', 'gender']
+    
+    for idx, *inputs in applicants_df[input_columns].itertuples(index=True, name=None):
+        scores = get_all_risk_scores(*inputs)
         
         if scores:
             results.append({
@@ -341,7 +417,7 @@ def interactive_calculator():
     print("   4 = 11+ years (oldest)")
     vehicle_age = int(input("Enter vehicle age category (1-4): "))
     
-    print(f"\n📋 Vehicle Body Types: {', '.join(le_body.classes_)}")
+    print(f"\n📋 Vehicle Body Types: {', '.join(BODY_CLASSES)}")
     vehicle_body = input("Enter vehicle body type: ").upper()
     
     # Get location